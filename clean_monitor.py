@@ -84,10 +84,14 @@ class CleanMonitor:
         power_db = 20 * np.log10(np.abs(fft_data) + 1e-12)
         actual_freqs = (center_freq + freqs) / 1e6
         
-        # Calculate metrics
+        # Calculate metrics (interpolated 10th percentile noise floor via partial sort)
         peak_power = np.max(power_db)
         avg_power = np.mean(power_db)
-        noise_floor = np.percentile(power_db, 10)
+        pos = 0.1 * (len(power_db) - 1)
+        k = int(pos)
+        k_next = min(k + 1, len(power_db) - 1)
+        ranked = np.partition(power_db, (k, k_next))
+        noise_floor = ranked[k] + (ranked[k_next] - ranked[k]) * (pos - k)
         snr = peak_power - noise_floor
         peak_freq = actual_freqs[np.argmax(power_db)]
         rms = np.sqrt(np.mean(np.abs(samples)**2))
@@ -34,7 +34,8 @@ __license__ = "GPL-2"
 # Import key classes and functions for easy access
 from .constants import (
     ConnectionType, ColorMap, WindowFunction, FrequencyLimits, GainLimits,
-    DEFAULT_SPECTRUM_CONFIG, DEFAULT_WATERFALL_CONFIG, DEFAULT_CALIBRATION_CONFIG
+    DEFAULT_SPECTRUM_CONFIG, DEFAULT_WATERFALL_CONFIG, DEFAULT_CALIBRATION_CONFIG,
+    LoggingConfig, get_default_formatter
 )
 
 from .exceptions import (
@@ -131,13 +132,19 @@ def setup_logging(level='INFO', format_string=None):
         format_string: Custom format string for log messages
     """
     if format_string is None:
-        format_string = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    
-    logging.basicConfig(
-        level=getattr(logging, level.upper()),
-        format=format_string,
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+        # Shared formatter from constants, so every handler formats the same way
+        handler = logging.StreamHandler()
+        handler.setFormatter(get_default_formatter())
+        logging.basicConfig(
+            level=getattr(logging, level.upper()),
+            handlers=[handler]
+        )
+    else:
+        logging.basicConfig(
+            level=getattr(logging, level.upper()),
+            format=format_string,
+            datefmt=LoggingConfig.DATE_FORMAT
+        )
     
     # Set specific loggers
     logger = logging.getLogger(__name__)
@@ -234,23 +241,23 @@ def initialize_toolkit():
         import scipy
         logger.debug("Core scientific libraries available")
         
-        # Check for optional dependencies
-        try:
-            import adi
+        # Check for optional dependencies without importing them; the heavy
+        # device modules are only loaded when a device is actually used
+        from importlib.util import find_spec
+        
+        if find_spec('adi') is not None:
             logger.debug("PyADI-IIO available")
-        except ImportError:
+        else:
             logger.warning("PyADI-IIO not available - device functionality limited")
         
-        try:
-            import iio
+        if find_spec('iio') is not None:
             logger.debug("libiio Python bindings available")
-        except ImportError:
+        else:
             logger.warning("libiio Python bindings not available")
         
-        try:
-            import PyQt6
+        if find_spec('PyQt6') is not None:
             logger.debug("PyQt6 available for GUI applications")
-        except ImportError:
+        else:
             logger.warning("PyQt6 not available - GUI functionality limited")
         
         logger.info("Enhanced ADALM-Pluto SDR Toolkit initialization complete")
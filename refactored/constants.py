@@ -9,8 +9,17 @@ Author: Enhanced SDR Tools - Refactored
 License: GPL-2 (compatible with original ADI scripts)
 """
 
+import logging
+import sys
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Tuple
+from types import SimpleNamespace
+from typing import Callable, Dict, Tuple
+
+from .exceptions import InvalidParameterError
+
+# dataclass(slots=True) is only available from Python 3.10
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 class ConnectionType(Enum):
@@ -42,102 +51,108 @@ class WindowFunction(Enum):
 
 
 # Device Discovery Constants
-class DeviceDiscovery:
-    """Constants for device discovery operations"""
-    DEFAULT_IPS = ['192.168.2.1', '192.168.1.10']
-    DISCOVERY_TIMEOUT = 5  # seconds
-    ZEROCONF_HOSTNAME = 'pluto.local'
-    USB_DEVICE_NAME = 'PLUTO'
+DeviceDiscovery = SimpleNamespace(
+    DEFAULT_IPS=['192.168.2.1', '192.168.1.10'],
+    DISCOVERY_TIMEOUT=5,  # seconds
+    CACHE_TTL=5.0,  # seconds
+    ZEROCONF_HOSTNAME='pluto.local',
+    ZEROCONF_SERVICE_TYPE='_iio._tcp.local.',
+    ZEROCONF_QUERY_TIMEOUT_MS=500,
+    USB_DEVICE_NAME='PLUTO',
+    USB_RETRY_DELAY=0.2,  # seconds, before retrying a timed out USB scan
+)
 
 
 # Frequency and Sample Rate Limits
-class FrequencyLimits:
-    """Frequency and sample rate limits for PlutoSDR"""
-    MIN_FREQUENCY = 70e6      # 70 MHz
-    MAX_FREQUENCY = 6e9       # 6 GHz
-    MIN_SAMPLE_RATE = 1e6     # 1 MHz
-    MAX_SAMPLE_RATE = 61e6    # 61 MHz
-    DEFAULT_CENTER_FREQ = 100e6  # 100 MHz
-    DEFAULT_SAMPLE_RATE = 20e6   # 20 MHz
+FrequencyLimits = SimpleNamespace(
+    MIN_FREQUENCY=70e6,  # 70 MHz
+    MAX_FREQUENCY=6e9,  # 6 GHz
+    MIN_SAMPLE_RATE=1e6,  # 1 MHz
+    MAX_SAMPLE_RATE=61e6,  # 61 MHz
+    DEFAULT_CENTER_FREQ=100e6,  # 100 MHz
+    DEFAULT_SAMPLE_RATE=20e6,  # 20 MHz
+)
 
 
 # Gain Limits
-class GainLimits:
-    """Gain limits for PlutoSDR"""
-    MIN_RX_GAIN = 0      # dB
-    MAX_RX_GAIN = 76     # dB
-    DEFAULT_RX_GAIN = 60 # dB
-    MIN_TX_GAIN = -89    # dB
-    MAX_TX_GAIN = 0      # dB
-    DEFAULT_TX_GAIN = -30 # dB
+GainLimits = SimpleNamespace(
+    MIN_RX_GAIN=0,  # dB
+    MAX_RX_GAIN=76,  # dB
+    DEFAULT_RX_GAIN=60,  # dB
+    MIN_TX_GAIN=-89,  # dB
+    MAX_TX_GAIN=0,  # dB
+    DEFAULT_TX_GAIN=-30,  # dB
+)
 
 
 # Temperature Thresholds
-class TemperatureThresholds:
-    """Temperature warning thresholds"""
-    AD9361_WARNING = 70.0    # °C
-    AD9361_CRITICAL = 80.0   # °C
-    ZYNQ_WARNING = 75.0      # °C
-    ZYNQ_CRITICAL = 85.0     # °C
+TemperatureThresholds = SimpleNamespace(
+    AD9361_WARNING=70.0,  # °C
+    AD9361_CRITICAL=80.0,  # °C
+    ZYNQ_WARNING=75.0,  # °C
+    ZYNQ_CRITICAL=85.0,  # °C
+)
 
 
 # FFT and Signal Processing
-class SignalProcessing:
-    """Constants for signal processing operations"""
-    DEFAULT_FFT_SIZE = 1024
-    AVAILABLE_FFT_SIZES = [256, 512, 1024, 2048, 4096]
-    DEFAULT_WINDOW = WindowFunction.HANN
-    MIN_PEAK_PROMINENCE = 5.0  # dB
-    MIN_PEAK_DISTANCE = 10     # bins
-    NOISE_FLOOR_OFFSET = 1e-12 # To avoid log(0)
+SignalProcessing = SimpleNamespace(
+    DEFAULT_FFT_SIZE=1024,
+    AVAILABLE_FFT_SIZES=[256, 512, 1024, 2048, 4096],
+    DEFAULT_WINDOW=WindowFunction.HANN,
+    MIN_PEAK_PROMINENCE=5.0,  # dB
+    MIN_PEAK_DISTANCE=10,  # bins
+    NOISE_FLOOR_OFFSET=1e-12,  # To avoid log(0)
+)
 
 
 # Waterfall Display
-class WaterfallDefaults:
-    """Default values for waterfall display"""
-    HISTORY_SIZE = 800
-    UPDATE_RATE_MS = 50
-    INTENSITY_MIN = -80.0  # dB
-    INTENSITY_MAX = -20.0  # dB
-    AVERAGING_FACTOR = 0.1
-    OVERLAP_RATIO = 0.5
+WaterfallDefaults = SimpleNamespace(
+    HISTORY_SIZE=800,
+    UPDATE_RATE_MS=50,
+    INTENSITY_MIN=-80.0,  # dB
+    INTENSITY_MAX=-20.0,  # dB
+    AVERAGING_FACTOR=0.1,
+    OVERLAP_RATIO=0.5,
+)
 
 
 # GUI Constants
-class GUIConstants:
-    """Constants for GUI applications"""
-    MAIN_WINDOW_WIDTH = 1600
-    MAIN_WINDOW_HEIGHT = 1000
-    STATUS_MESSAGE_TIMEOUT = 3000  # ms
-    PLOT_UPDATE_INTERVAL = 50      # ms
-    TEMPERATURE_UPDATE_INTERVAL = 5 # seconds
+GUIConstants = SimpleNamespace(
+    MAIN_WINDOW_WIDTH=1600,
+    MAIN_WINDOW_HEIGHT=1000,
+    STATUS_MESSAGE_TIMEOUT=3000,  # ms
+    PLOT_UPDATE_INTERVAL=50,  # ms
+    TEMPERATURE_UPDATE_INTERVAL=5,  # seconds
+)
 
 
 # Calibration Constants
-class CalibrationDefaults:
-    """Default values for calibration procedures"""
-    DEFAULT_RX_LO = 2400000000  # 2.4 GHz
-    DEFAULT_TX_LO = 2400000000  # 2.4 GHz
-    DEFAULT_CAL_SAMPLE_RATE = 3000000  # 3 MHz
-    PEAK_THRESHOLD_OFFSET = 20  # dB below max
-    CORRELATION_THRESHOLD = 0.5 # For loopback test
+CalibrationDefaults = SimpleNamespace(
+    DEFAULT_RX_LO=2400000000,  # 2.4 GHz
+    DEFAULT_TX_LO=2400000000,  # 2.4 GHz
+    DEFAULT_CAL_SAMPLE_RATE=3000000,  # 3 MHz
+    PEAK_THRESHOLD_OFFSET=20,  # dB below max
+    CORRELATION_THRESHOLD=0.5,  # For loopback test
+)
 
 
 # File and Data Constants
-class FileConstants:
-    """Constants for file operations"""
-    CSV_HEADER = "Frequency_GHz,Amplitude_dB"
-    DEFAULT_EXPORT_FORMAT = "csv"
-    CONFIG_FILE_EXTENSION = ".json"
-    LOG_FILE_EXTENSION = ".log"
+FileConstants = SimpleNamespace(
+    CSV_HEADER="Frequency_GHz,Amplitude_dB",
+    DEFAULT_EXPORT_FORMAT="csv",
+    CONFIG_FILE_EXTENSION=".json",
+    LOG_FILE_EXTENSION=".log",
+)
 
 
 # Network Constants
-class NetworkConstants:
-    """Constants for network operations"""
-    CONNECTION_TIMEOUT = 10  # seconds
-    RETRY_ATTEMPTS = 3
-    RETRY_DELAY = 1  # seconds
+NetworkConstants = SimpleNamespace(
+    CONNECTION_TIMEOUT=10,  # seconds
+    PROBE_TIMEOUT=2,  # seconds, TCP reachability probe
+    IIOD_PORT=30431,  # IIO daemon TCP port
+    RETRY_ATTEMPTS=3,
+    RETRY_DELAY=1,  # seconds
+)
 
 
 # Known Frequency Bands
@@ -156,88 +171,130 @@ KNOWN_FREQUENCY_BANDS: Dict[str, Tuple[float, float]] = {
 
 
 # Error Messages
-class ErrorMessages:
-    """Standardized error messages"""
-    DEVICE_NOT_FOUND = "No PlutoSDR device found"
-    DEVICE_NOT_CONNECTED = "PlutoSDR device not connected"
-    CONNECTION_FAILED = "Failed to connect to PlutoSDR device"
-    INVALID_FREQUENCY = "Invalid frequency value"
-    INVALID_SAMPLE_RATE = "Invalid sample rate value"
-    INVALID_GAIN = "Invalid gain value"
-    CALIBRATION_FAILED = "Device calibration failed"
-    SIGNAL_GENERATION_FAILED = "Signal generation failed"
-    FILE_SAVE_FAILED = "Failed to save file"
-    FILE_LOAD_FAILED = "Failed to load file"
+ErrorMessages = SimpleNamespace(
+    DEVICE_NOT_FOUND=sys.intern("No PlutoSDR device found"),
+    DEVICE_NOT_CONNECTED=sys.intern("PlutoSDR device not connected"),
+    CONNECTION_FAILED=sys.intern("Failed to connect to PlutoSDR device"),
+    INVALID_FREQUENCY=sys.intern("Invalid frequency value"),
+    INVALID_SAMPLE_RATE=sys.intern("Invalid sample rate value"),
+    INVALID_GAIN=sys.intern("Invalid gain value"),
+    CALIBRATION_FAILED=sys.intern("Device calibration failed"),
+    SIGNAL_GENERATION_FAILED=sys.intern("Signal generation failed"),
+    FILE_SAVE_FAILED=sys.intern("Failed to save file"),
+    FILE_LOAD_FAILED=sys.intern("Failed to load file"),
+)
 
 
 # Success Messages
-class SuccessMessages:
-    """Standardized success messages"""
-    DEVICE_CONNECTED = "Successfully connected to PlutoSDR"
-    DEVICE_DISCONNECTED = "Device disconnected successfully"
-    CALIBRATION_COMPLETE = "Calibration completed successfully"
-    SIGNAL_TRANSMITTED = "Signal transmission started"
-    FILE_SAVED = "File saved successfully"
-    CONFIG_LOADED = "Configuration loaded successfully"
+SuccessMessages = SimpleNamespace(
+    DEVICE_CONNECTED=sys.intern("Successfully connected to PlutoSDR"),
+    DEVICE_DISCONNECTED=sys.intern("Device disconnected successfully"),
+    CALIBRATION_COMPLETE=sys.intern("Calibration completed successfully"),
+    SIGNAL_TRANSMITTED=sys.intern("Signal transmission started"),
+    FILE_SAVED=sys.intern("File saved successfully"),
+    CONFIG_LOADED=sys.intern("Configuration loaded successfully"),
+)
 
 
 # Application Metadata
-class AppMetadata:
-    """Application metadata and version information"""
-    NAME = "Enhanced ADALM-Pluto SDR Toolkit"
-    VERSION = "2.0.0"
-    AUTHOR = "Enhanced SDR Tools"
-    LICENSE = "GPL-2"
-    DESCRIPTION = "Comprehensive SDR toolkit integrating multiple ADI repositories"
-    
+AppMetadata = SimpleNamespace(
+    NAME="Enhanced ADALM-Pluto SDR Toolkit",
+    VERSION="2.0.0",
+    AUTHOR="Enhanced SDR Tools",
+    LICENSE="GPL-2",
+    DESCRIPTION="Comprehensive SDR toolkit integrating multiple ADI repositories",
+
     # Integrated repositories
-    INTEGRATED_REPOS = [
+    INTEGRATED_REPOS=[
         "ADALM-Pluto-Spectrum-Analyzer (original)",
         "plutosdr_scripts (Analog Devices)",
         "plutosdr-fw (Analog Devices)",
         "waterfall display (inspired by Stvff/waterfall)"
-    ]
+    ],
+)
 
 
 # Logging Configuration
-class LoggingConfig:
-    """Logging configuration constants"""
-    DEFAULT_LEVEL = "INFO"
-    FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
-    MAX_LOG_SIZE = 10 * 1024 * 1024  # 10 MB
-    BACKUP_COUNT = 5
+LoggingConfig = SimpleNamespace(
+    DEFAULT_LEVEL="INFO",
+    FORMAT="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    DATE_FORMAT="%Y-%m-%d %H:%M:%S",
+    MAX_LOG_SIZE=10 * 1024 * 1024,  # 10 MB
+    BACKUP_COUNT=5,
+)
+
+
+# Shared log formatter, built once at import instead of per logger setup
+_DEFAULT_FORMATTER = logging.Formatter(LoggingConfig.FORMAT, LoggingConfig.DATE_FORMAT)
+
+
+def get_default_formatter() -> logging.Formatter:
+    """Get the shared default log formatter"""
+    return _DEFAULT_FORMATTER
 
 
 # Performance Constants
-class PerformanceConstants:
-    """Constants for performance optimization"""
-    MAX_BUFFER_SIZE = 1024 * 1024  # 1 MB
-    CHUNK_SIZE = 4096
-    THREAD_POOL_SIZE = 4
-    CACHE_SIZE = 100  # Number of items to cache
+PerformanceConstants = SimpleNamespace(
+    MAX_BUFFER_SIZE=1024 * 1024,  # 1 MB
+    CHUNK_SIZE=4096,
+    THREAD_POOL_SIZE=4,
+    CACHE_SIZE=100,  # Number of items to cache
+    DEVICE_POOL_SIZE=3,  # Open devices kept for quick reconnects
+    DEVICE_POOL_IDLE_TIMEOUT=30.0,  # seconds before a pooled device is closed
+)
 
 
 # Validation Ranges
-class ValidationRanges:
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class _ValidationRanges:
     """Validation ranges for various parameters"""
-    AMPLITUDE_RANGE = (0.0, 1.0)
-    PHASE_RANGE = (0.0, 360.0)
-    DURATION_RANGE = (0.001, 10.0)  # seconds
-    FFT_SIZE_RANGE = (256, 4096)
-    HISTORY_SIZE_RANGE = (100, 2000)
-    UPDATE_RATE_RANGE = (10, 1000)  # ms
+    AMPLITUDE_RANGE: Tuple[float, float] = (0.0, 1.0)
+    PHASE_RANGE: Tuple[float, float] = (0.0, 360.0)
+    DURATION_RANGE: Tuple[float, float] = (0.001, 10.0)  # seconds
+    FFT_SIZE_RANGE: Tuple[int, int] = (256, 4096)
+    HISTORY_SIZE_RANGE: Tuple[int, int] = (100, 2000)
+    UPDATE_RATE_RANGE: Tuple[int, int] = (10, 1000)  # ms
+    AVERAGING_FACTOR_RANGE: Tuple[float, float] = (0.0, 1.0)
+
+
+ValidationRanges = _ValidationRanges()
+
+
+def _make_range_validator(lo: float, hi: float, name: str) -> Callable[[float], None]:
+    """
+    Build a validator with the range bounds bound as closure constants
+    
+    Args:
+        lo: Minimum allowed value
+        hi: Maximum allowed value
+        name: Name of the parameter for error messages
+        
+    Returns:
+        Function raising InvalidParameterError for out-of-range values
+    """
+    valid_range = f"{lo}-{hi}"
+    
+    def validate(value: float) -> None:
+        if not (lo <= value <= hi):
+            raise InvalidParameterError(name, value, valid_range)
+    
+    return validate
+
+
+# Precomputed range validators
+VALIDATE_FFT_SIZE = _make_range_validator(*ValidationRanges.FFT_SIZE_RANGE, "fft_size")
+VALIDATE_AVERAGING_FACTOR = _make_range_validator(*ValidationRanges.AVERAGING_FACTOR_RANGE, "averaging_factor")
 
 
 # Unit Conversion Factors
-class UnitConversion:
-    """Unit conversion factors"""
-    HZ_TO_MHZ = 1e-6
-    HZ_TO_GHZ = 1e-9
-    MHZ_TO_HZ = 1e6
-    GHZ_TO_HZ = 1e9
-    MS_TO_S = 1e-3
-    S_TO_MS = 1e3
+UnitConversion = SimpleNamespace(
+    HZ_TO_MHZ=1e-6,
+    HZ_TO_GHZ=1e-9,
+    MHZ_TO_HZ=1e6,
+    GHZ_TO_HZ=1e9,
+    MS_TO_S=1e-3,
+    S_TO_MS=1e3,
+)
 
 
 # Default Configurations
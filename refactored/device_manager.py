@@ -10,44 +10,101 @@ Author: Enhanced SDR Tools - Refactored
 License: GPL-2 (compatible with original ADI scripts)
 """
 
+import errno
+import importlib
 import logging
+import selectors
+import socket
 import subprocess
+import threading
 import time
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from typing import Optional, List, Dict, Any, Set, Tuple
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
 from .constants import (
-    ConnectionType, DeviceDiscovery, FrequencyLimits, GainLimits,
-    NetworkConstants, TemperatureThresholds
+    DATACLASS_SLOTS, ConnectionType, DeviceDiscovery, FrequencyLimits, GainLimits,
+    NetworkConstants, PerformanceConstants, TemperatureThresholds
 )
 from .exceptions import (
     DeviceNotFoundError, DeviceConnectionError, DeviceNotConnectedError,
     DeviceTimeoutError, OvertemperatureError, TemperatureReadError,
     handle_device_error, validate_frequency, validate_sample_rate, validate_gain
 )
-from .utils import retry_on_failure, timeout_after, PerformanceTimer
+from .utils import timeout_after, PerformanceTimer
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Optional imports with fallback
-try:
-    import adi
-    ADI_AVAILABLE = True
-except ImportError:
-    ADI_AVAILABLE = False
-    logger.warning("PyADI-IIO not available - device functionality limited")
+# Heavy optional imports (adi, iio) are deferred until first use
+_lazy_modules: Dict[str, Any] = {}
+
+
+def _lazy_import(name: str, missing_message: str):
+    """Import an optional module on first use, caching the module or None"""
+    try:
+        return _lazy_modules[name]
+    except KeyError:
+        pass
+    
+    try:
+        module = importlib.import_module(name)
+    except ImportError:
+        module = None
+        logger.warning(missing_message)
+    
+    _lazy_modules[name] = module
+    return module
+
+
+def _get_adi():
+    """Get the PyADI-IIO module, or None if not installed"""
+    return _lazy_import('adi', "PyADI-IIO not available - device functionality limited")
+
+
+def _get_iio():
+    """Get the libiio Python bindings, or None if not installed"""
+    return _lazy_import('iio', "libiio Python bindings not available")
+
+
+def __getattr__(name: str):
+    """Resolve ADI_AVAILABLE / IIO_AVAILABLE lazily"""
+    if name == 'ADI_AVAILABLE':
+        return _get_adi() is not None
+    if name == 'IIO_AVAILABLE':
+        return _get_iio() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 try:
-    import iio
-    IIO_AVAILABLE = True
+    from zeroconf import Zeroconf
+    ZEROCONF_AVAILABLE = True
 except ImportError:
-    IIO_AVAILABLE = False
-    logger.warning("libiio Python bindings not available")
+    ZEROCONF_AVAILABLE = False
+    logger.debug("zeroconf not available - falling back to avahi-resolve")
 
+# Discovery results keyed by the discoverer set, as (timestamp, devices)
+_discovery_cache: Dict[Tuple[str, ...], Tuple[float, List["DeviceInfo"]]] = {}
 
-@dataclass
+# connect_ex results meaning a nonblocking connect is still pending (or done)
+_CONNECT_IN_PROGRESS = (0, errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN)
+
+# Per-IP reachability results as (timestamp, reachable)
+_ip_probe_cache: Dict[str, Tuple[float, bool]] = {}
+
+# Resolved mDNS hostnames as (timestamp, ip)
+_hostname_cache: Dict[str, Tuple[float, str]] = {}
+
+
+def invalidate_discovery_cache() -> None:
+    """Clear cached discovery results, IP probes and hostnames"""
+    _discovery_cache.clear()
+    _ip_probe_cache.clear()
+    _hostname_cache.clear()
+
+
+@dataclass(**DATACLASS_SLOTS)
 class DeviceInfo:
     """Information about a discovered PlutoSDR device"""
     uri: str
@@ -58,7 +115,14 @@ class DeviceInfo:
     hardware_revision: Optional[str] = None
 
 
-@dataclass
+# (attribute, label, warning threshold, critical threshold) per temperature sensor
+_TEMP_SENSORS = (
+    ('ad9361', 'AD9361', TemperatureThresholds.AD9361_WARNING, TemperatureThresholds.AD9361_CRITICAL),
+    ('zynq', 'Zynq', TemperatureThresholds.ZYNQ_WARNING, TemperatureThresholds.ZYNQ_CRITICAL),
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TemperatureReading:
     """Temperature reading from device sensors"""
     ad9361: Optional[float] = None
@@ -78,21 +142,26 @@ class TemperatureReading:
         """Check for temperature warnings"""
         warnings = []
         
-        if self.ad9361 is not None:
-            if self.ad9361 > TemperatureThresholds.AD9361_CRITICAL:
-                warnings.append(f"AD9361 temperature critical: {self.ad9361:.1f}°C")
-            elif self.ad9361 > TemperatureThresholds.AD9361_WARNING:
-                warnings.append(f"AD9361 temperature high: {self.ad9361:.1f}°C")
-        
-        if self.zynq is not None:
-            if self.zynq > TemperatureThresholds.ZYNQ_CRITICAL:
-                warnings.append(f"Zynq temperature critical: {self.zynq:.1f}°C")
-            elif self.zynq > TemperatureThresholds.ZYNQ_WARNING:
-                warnings.append(f"Zynq temperature high: {self.zynq:.1f}°C")
+        for attr, label, warning_threshold, critical_threshold in _TEMP_SENSORS:
+            value = getattr(self, attr)
+            if value is None:
+                continue
+            if value > critical_threshold:
+                warnings.append(f"{label} temperature critical: {value:.1f}°C")
+            elif value > warning_threshold:
+                warnings.append(f"{label} temperature high: {value:.1f}°C")
         
         return warnings
 
 
+# IIO context attribute -> DeviceInfo field
+_INFO_ATTR_MAP = {
+    'fw_version': 'firmware_version',
+    'hw_serial': 'serial_number',
+    'hw_model': 'hardware_revision',
+}
+
+
 class DeviceDiscoverer(ABC):
     """Abstract base class for device discovery methods"""
     
@@ -105,38 +174,107 @@ class DeviceDiscoverer(ABC):
 class USBDiscoverer(DeviceDiscoverer):
     """USB device discovery"""
     
-    @retry_on_failure(max_attempts=2, delay=1.0)
     def discover(self) -> List[DeviceInfo]:
         """Discover USB-connected PlutoSDR devices"""
-        devices = []
-        
-        if not IIO_AVAILABLE:
+        iio = _get_iio()
+        if iio is None:
             logger.debug("libiio not available for USB discovery")
-            return devices
+            return []
         
         try:
-            # Use iio_info to scan for USB devices
-            result = subprocess.run(
-                ['iio_info', '-s'],
-                capture_output=True,
-                text=True,
-                timeout=DeviceDiscovery.DISCOVERY_TIMEOUT
-            )
+            # Scan in-process with libiio when the bindings support it
+            devices = self._scan_with_libiio(iio)
+        except Exception as e:
+            logger.debug(f"libiio context scan unavailable ({e}), falling back to iio_info")
+            devices = self._scan_with_iio_info()
+        
+        logger.debug(f"USB discovery found {len(devices)} device(s)")
+        return devices
+    
+    def _scan_with_libiio(self, iio) -> List[DeviceInfo]:
+        """Enumerate PlutoSDR contexts with iio.scan_contexts()"""
+        devices = []
+        
+        for uri, description in iio.scan_contexts().items():
+            if DeviceDiscovery.USB_DEVICE_NAME.lower() in description.lower():
+                devices.append(DeviceInfo(
+                    uri=uri,
+                    connection_type=ConnectionType.USB if uri.startswith('usb:') else ConnectionType.IP
+                ))
+        
+        return devices
+    
+    def _run_iio_info_scan(self) -> List[DeviceInfo]:
+        """Run iio_info -s, retrying once only if the scan timed out"""
+        # Both attempts and the pause between them fit in DISCOVERY_TIMEOUT,
+        # which is as long as the callers wait for a discovery method
+        attempt_timeout = (DeviceDiscovery.DISCOVERY_TIMEOUT - DeviceDiscovery.USB_RETRY_DELAY) / 2
+        for attempt in range(2):
+            try:
+                return self._stream_iio_info_scan(attempt_timeout)
+            except subprocess.TimeoutExpired:
+                if attempt:
+                    raise
+                logger.debug("USB scan timed out, retrying once")
+                time.sleep(DeviceDiscovery.USB_RETRY_DELAY)
+    
+    def _stream_iio_info_scan(self, timeout: float) -> List[DeviceInfo]:
+        """
+        Run iio_info -s once, parsing its output line by line as it streams
+        
+        Args:
+            timeout: Seconds before the scan is killed
+        
+        Returns:
+            Devices found, or an empty list if iio_info exited with an error
             
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
+        Raises:
+            subprocess.TimeoutExpired: If the scan exceeds timeout
+        """
+        devices = []
+        timed_out = threading.Event()
+        
+        with subprocess.Popen(
+            ['iio_info', '-s'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1
+        ) as process:
+            def kill_on_timeout() -> None:
+                timed_out.set()
+                process.kill()
+            
+            killer = threading.Timer(timeout, kill_on_timeout)
+            killer.start()
+            try:
+                for line in process.stdout:
                     if DeviceDiscovery.USB_DEVICE_NAME.lower() in line.lower():
-                        # Extract URI from iio_info output
-                        parts = line.split()
-                        for part in parts:
+                        # Extract URI from iio_info output (e.g. "[usb:1.5.5]")
+                        for part in line.split():
+                            part = part.strip('[],')
                             if part.startswith('usb:'):
                                 devices.append(DeviceInfo(
-                                    uri=part.rstrip(','),
+                                    uri=part,
                                     connection_type=ConnectionType.USB
                                 ))
                                 break
-            
-            logger.debug(f"USB discovery found {len(devices)} device(s)")
+            finally:
+                killer.cancel()
+            returncode = process.wait()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(['iio_info', '-s'], timeout)
+        
+        return devices if returncode == 0 else []
+    
+    def _scan_with_iio_info(self) -> List[DeviceInfo]:
+        """Enumerate USB PlutoSDR contexts with the iio_info command"""
+        devices = []
+        
+        try:
+            # Use iio_info to scan for USB devices
+            devices = self._run_iio_info_scan()
             
         except subprocess.TimeoutExpired:
             logger.warning("USB discovery timed out")
@@ -154,50 +292,96 @@ class IPDiscoverer(DeviceDiscoverer):
     def discover(self) -> List[DeviceInfo]:
         """Discover IP-connected PlutoSDR devices"""
         devices = []
+        ips = DeviceDiscovery.DEFAULT_IPS
         
-        for ip in DeviceDiscovery.DEFAULT_IPS:
+        # Scan all uncached or expired IPs at once so unreachable hosts don't stall the scan
+        now = time.monotonic()
+        pending = [ip for ip in ips
+                   if ip not in _ip_probe_cache
+                   or now - _ip_probe_cache[ip][0] >= DeviceDiscovery.CACHE_TTL]
+        if pending:
             try:
-                # Test connection to IP
-                if self._test_ip_connection(ip):
-                    devices.append(DeviceInfo(
-                        uri=f"ip:{ip}",
-                        connection_type=ConnectionType.IP,
-                        ip_address=ip
-                    ))
-                    logger.debug(f"Found device at IP: {ip}")
-            
+                open_ips = self._scan_iiod_ports(pending)
             except Exception as e:
-                logger.debug(f"IP discovery error for {ip}: {e}")
+                logger.debug(f"IP port scan error: {e}")
+                open_ips = set()
+            
+            for ip in pending:
+                reachable = ip in open_ips and self._test_ip_connection(ip)
+                _ip_probe_cache[ip] = (time.monotonic(), reachable)
+        
+        for ip in ips:
+            if _ip_probe_cache.get(ip, (0.0, False))[1]:
+                devices.append(DeviceInfo(
+                    uri=f"ip:{ip}",
+                    connection_type=ConnectionType.IP,
+                    ip_address=ip
+                ))
+                logger.debug(f"Found device at IP: {ip}")
         
         logger.debug(f"IP discovery found {len(devices)} device(s)")
         return devices
     
+    def _scan_iiod_ports(self, ips: List[str]) -> Set[str]:
+        """
+        Probe the IIO daemon port on all IPs with nonblocking connects
+        
+        Args:
+            ips: IP addresses to probe
+            
+        Returns:
+            Set of IPs that accepted a connection within PROBE_TIMEOUT
+        """
+        reachable = set()
+        selector = selectors.DefaultSelector()
+        
+        try:
+            for ip in ips:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                result = sock.connect_ex((ip, NetworkConstants.IIOD_PORT))
+                if result in _CONNECT_IN_PROGRESS:
+                    selector.register(sock, selectors.EVENT_WRITE, ip)
+                else:
+                    sock.close()
+            
+            deadline = time.monotonic() + NetworkConstants.PROBE_TIMEOUT
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                
+                for key, _ in selector.select(remaining):
+                    sock = key.fileobj
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        reachable.add(key.data)
+                    selector.unregister(sock)
+                    sock.close()
+        finally:
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+            selector.close()
+        
+        return reachable
+    
     @timeout_after(NetworkConstants.CONNECTION_TIMEOUT)
     def _test_ip_connection(self, ip: str) -> bool:
-        """Test if PlutoSDR is accessible at IP address"""
+        """Test if a PlutoSDR answers at an IP address with an open IIOD port"""
         try:
-            # Try to ping the IP first
-            result = subprocess.run(
-                ['ping', '-c', '1', '-W', '2', ip],
-                capture_output=True,
-                timeout=5
-            )
-            
-            if result.returncode == 0:
-                # If ping succeeds, try to connect with iio
-                if IIO_AVAILABLE:
-                    try:
-                        ctx = iio.Context(f"ip:{ip}")
-                        devices = ctx.devices
-                        # Look for AD9361 device
-                        for device in devices:
-                            if 'ad9361' in device.name.lower():
-                                return True
-                    except:
-                        pass
-                else:
-                    # Fallback: assume ping success means device is there
-                    return True
+            iio = _get_iio()
+            if iio is not None:
+                try:
+                    ctx = iio.Context(f"ip:{ip}")
+                    devices = ctx.devices
+                    # Look for AD9361 device
+                    for device in devices:
+                        if 'ad9361' in device.name.lower():
+                            return True
+                except:
+                    pass
+            else:
+                # Fallback: assume an open IIOD port means device is there
+                return True
             
             return False
             
@@ -213,28 +397,23 @@ class ZeroconfDiscoverer(DeviceDiscoverer):
         devices = []
         
         try:
-            # Try to resolve pluto.local
-            result = subprocess.run(
-                ['avahi-resolve', '--name', DeviceDiscovery.ZEROCONF_HOSTNAME],
-                capture_output=True,
-                text=True,
-                timeout=DeviceDiscovery.DISCOVERY_TIMEOUT
-            )
+            ip = self._resolve_cached()
+            if ip is None:
+                # Resolve pluto.local in-process when possible, else via avahi-resolve
+                if ZEROCONF_AVAILABLE:
+                    ip = self._resolve_with_zeroconf()
+                else:
+                    ip = self._resolve_with_avahi()
+                if ip:
+                    _hostname_cache[DeviceDiscovery.ZEROCONF_HOSTNAME] = (time.monotonic(), ip)
             
-            if result.returncode == 0:
-                # Extract IP from avahi-resolve output
-                for line in result.stdout.split('\n'):
-                    if DeviceDiscovery.ZEROCONF_HOSTNAME in line:
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            ip = parts[1]
-                            devices.append(DeviceInfo(
-                                uri=f"ip:{ip}",
-                                connection_type=ConnectionType.ZEROCONF,
-                                ip_address=ip
-                            ))
-                            logger.debug(f"Zeroconf found device at: {ip}")
-                            break
+            if ip:
+                devices.append(DeviceInfo(
+                    uri=f"ip:{ip}",
+                    connection_type=ConnectionType.ZEROCONF,
+                    ip_address=ip
+                ))
+                logger.debug(f"Zeroconf found device at: {ip}")
         
         except subprocess.TimeoutExpired:
             logger.debug("Zeroconf discovery timed out")
@@ -245,11 +424,74 @@ class ZeroconfDiscoverer(DeviceDiscoverer):
         
         logger.debug(f"Zeroconf discovery found {len(devices)} device(s)")
         return devices
+    
+    def _resolve_cached(self) -> Optional[str]:
+        """Resolve the PlutoSDR hostname from the TTL cache or the system resolver"""
+        hostname = DeviceDiscovery.ZEROCONF_HOSTNAME
+        
+        cached = _hostname_cache.get(hostname)
+        if cached is not None and time.monotonic() - cached[0] < DeviceDiscovery.CACHE_TTL:
+            return cached[1]
+        
+        # Works without any subprocess when nss-mdns is configured
+        try:
+            ip = socket.gethostbyname(hostname)
+        except (socket.gaierror, UnicodeError):
+            return None
+        
+        _hostname_cache[hostname] = (time.monotonic(), ip)
+        return ip
+    
+    def _resolve_with_zeroconf(self) -> Optional[str]:
+        """Resolve the PlutoSDR IIO service with the zeroconf library"""
+        instance = DeviceDiscovery.ZEROCONF_HOSTNAME.split('.')[0]
+        service_type = DeviceDiscovery.ZEROCONF_SERVICE_TYPE
+        
+        zc = Zeroconf()
+        try:
+            info = zc.get_service_info(
+                service_type,
+                f"{instance}.{service_type}",
+                timeout=DeviceDiscovery.ZEROCONF_QUERY_TIMEOUT_MS
+            )
+        finally:
+            zc.close()
+        
+        if info is None:
+            return None
+        
+        addresses = info.parsed_addresses()
+        return addresses[0] if addresses else None
+    
+    def _resolve_with_avahi(self) -> Optional[str]:
+        """Resolve the PlutoSDR hostname with the avahi-resolve command"""
+        result = subprocess.run(
+            ['avahi-resolve', '--name', DeviceDiscovery.ZEROCONF_HOSTNAME],
+            capture_output=True,
+            text=True,
+            timeout=DeviceDiscovery.DISCOVERY_TIMEOUT
+        )
+        
+        if result.returncode == 0:
+            # Extract IP from avahi-resolve output
+            for line in result.stdout.split('\n'):
+                if DeviceDiscovery.ZEROCONF_HOSTNAME in line:
+                    parts = line.split()
+                    if len(parts) >= 2:
+                        return parts[1]
+        
+        return None
 
 
 class PlutoSDRDevice:
     """Represents a connected PlutoSDR device"""
     
+    __slots__ = (
+        'device_info', 'sdr', 'rx_device', 'tx_device',
+        '_ad9361_temp_channel', '_xadc_temp_channel',
+        '_is_connected', '_last_temperature_reading'
+    )
+    
     def __init__(self, device_info: DeviceInfo):
         """
         Initialize PlutoSDR device
@@ -261,13 +503,16 @@ class PlutoSDRDevice:
         self.sdr = None
         self.rx_device = None
         self.tx_device = None
+        self._ad9361_temp_channel = None
+        self._xadc_temp_channel = None
         self._is_connected = False
         self._last_temperature_reading = None
     
     @property
     def is_connected(self) -> bool:
         """Check if device is connected"""
-        return self._is_connected and self.sdr is not None
+        # _is_connected is only set after self.sdr is assigned and cleared together with it
+        return self._is_connected
     
     @handle_device_error
     def connect(self) -> bool:
@@ -284,7 +529,8 @@ class PlutoSDRDevice:
             logger.debug("Device already connected")
             return True
         
-        if not ADI_AVAILABLE:
+        adi = _get_adi()
+        if adi is None:
             raise DeviceConnectionError(
                 self.device_info.uri, 
                 "PyADI-IIO not available"
@@ -295,9 +541,15 @@ class PlutoSDRDevice:
                 # Create SDR object
                 self.sdr = adi.Pluto(uri=self.device_info.uri)
                 
-                # Get IIO context for low-level operations
-                if IIO_AVAILABLE:
-                    ctx = iio.Context(self.device_info.uri)
+                # Get IIO context for low-level operations, reusing the one pyadi
+                # already opened before falling back to a new context
+                ctx = getattr(self.sdr, '_ctx', None)
+                if ctx is None:
+                    iio = _get_iio()
+                    if iio is not None:
+                        ctx = iio.Context(self.device_info.uri)
+                
+                if ctx is not None:
                     self.rx_device = ctx.find_device("cf-ad9361-lpc")
                     self.tx_device = ctx.find_device("cf-ad9361-dds-core-lpc")
                 
@@ -309,52 +561,81 @@ class PlutoSDRDevice:
                 
                 # Update device info with additional details
                 self._update_device_info()
+                self._cache_sensor_channels()
                 
                 return True
         
         except Exception as e:
-            self.sdr = None
-            self.rx_device = None
-            self.tx_device = None
-            self._is_connected = False
+            self._clear_connection_state()
             raise DeviceConnectionError(self.device_info.uri, str(e))
     
     def disconnect(self) -> None:
         """Disconnect from the device"""
         if self.is_connected:
-            try:
-                # Clean up resources
-                if hasattr(self.sdr, 'rx_destroy_buffer'):
-                    self.sdr.rx_destroy_buffer()
-                if hasattr(self.sdr, 'tx_destroy_buffer'):
-                    self.sdr.tx_destroy_buffer()
-            except:
-                pass  # Ignore cleanup errors
-            
-            self.sdr = None
-            self.rx_device = None
-            self.tx_device = None
-            self._is_connected = False
+            self.destroy_buffers()
+            self._clear_connection_state()
             logger.info("Disconnected from PlutoSDR")
     
+    def destroy_buffers(self) -> None:
+        """Stop streaming: destroy the RX buffer and any (cyclic) TX buffer"""
+        if self.sdr is None:
+            return
+        try:
+            # Clean up resources
+            if hasattr(self.sdr, 'rx_destroy_buffer'):
+                self.sdr.rx_destroy_buffer()
+            if hasattr(self.sdr, 'tx_destroy_buffer'):
+                self.sdr.tx_destroy_buffer()
+        except:
+            pass  # Ignore cleanup errors
+    
+    def _clear_connection_state(self) -> None:
+        """Drop all handles tied to the current connection"""
+        self.sdr = None
+        self.rx_device = None
+        self.tx_device = None
+        self._ad9361_temp_channel = None
+        self._xadc_temp_channel = None
+        self._is_connected = False
+    
+    def _cache_sensor_channels(self) -> None:
+        """Look up the temperature sensor channels once per connection"""
+        try:
+            ctx = self.sdr._ctx
+        except AttributeError:
+            return
+        
+        try:
+            ad9361_phy = ctx.find_device("ad9361-phy")
+            if ad9361_phy:
+                self._ad9361_temp_channel = ad9361_phy.find_channel("temp0", False)
+        except Exception as e:
+            logger.debug(f"Could not find AD9361 temperature channel: {e}")
+        
+        try:
+            xadc = ctx.find_device("xadc")
+            if xadc:
+                self._xadc_temp_channel = xadc.find_channel("temp0", False)
+        except Exception as e:
+            logger.debug(f"Could not find Zynq temperature channel: {e}")
+    
     def _update_device_info(self) -> None:
         """Update device info with additional details from connected device"""
         if not self.is_connected:
             return
         
+        try:
+            attrs = self.sdr._ctx.attrs
+        except AttributeError:
+            return
+        
         try:
             # Try to get firmware version and other details
-            if hasattr(self.sdr, '_ctx'):
-                ctx = self.sdr._ctx
-                if hasattr(ctx, 'attrs'):
-                    for attr_name in ctx.attrs:
-                        attr = ctx.attrs[attr_name]
-                        if 'fw_version' in attr_name.lower():
-                            self.device_info.firmware_version = attr.value
-                        elif 'serial' in attr_name.lower():
-                            self.device_info.serial_number = attr.value
-                        elif 'hw_model' in attr_name.lower():
-                            self.device_info.hardware_revision = attr.value
+            for attr_name, field_name in _INFO_ATTR_MAP.items():
+                attr = attrs.get(attr_name)
+                if attr is not None:
+                    # libiio exposes context attributes as plain strings; older wrappers use .value
+                    setattr(self.device_info, field_name, getattr(attr, 'value', attr))
         except Exception as e:
             logger.debug(f"Could not update device info: {e}")
     
@@ -384,35 +665,42 @@ class PlutoSDRDevice:
         if not self.is_connected:
             raise DeviceNotConnectedError("configure_basic_settings")
         
+        # Validate everything up front so a bad value never leaves a partial update
         try:
-            # Validate and set parameters
+            if sample_rate is not None:
+                validate_sample_rate(sample_rate, FrequencyLimits.MIN_SAMPLE_RATE, FrequencyLimits.MAX_SAMPLE_RATE)
             if rx_lo is not None:
                 validate_frequency(rx_lo, FrequencyLimits.MIN_FREQUENCY, FrequencyLimits.MAX_FREQUENCY)
-                self.sdr.rx_lo = rx_lo
-            
             if tx_lo is not None:
                 validate_frequency(tx_lo, FrequencyLimits.MIN_FREQUENCY, FrequencyLimits.MAX_FREQUENCY)
-                self.sdr.tx_lo = tx_lo
-            
-            if sample_rate is not None:
-                validate_sample_rate(sample_rate, FrequencyLimits.MIN_SAMPLE_RATE, FrequencyLimits.MAX_SAMPLE_RATE)
-                self.sdr.sample_rate = sample_rate
-            
             if rx_bandwidth is not None:
                 validate_sample_rate(rx_bandwidth, FrequencyLimits.MIN_SAMPLE_RATE, FrequencyLimits.MAX_SAMPLE_RATE)
-                self.sdr.rx_rf_bandwidth = rx_bandwidth
-            
             if tx_bandwidth is not None:
                 validate_sample_rate(tx_bandwidth, FrequencyLimits.MIN_SAMPLE_RATE, FrequencyLimits.MAX_SAMPLE_RATE)
-                self.sdr.tx_rf_bandwidth = tx_bandwidth
-            
             if rx_gain is not None:
                 validate_gain(rx_gain, GainLimits.MIN_RX_GAIN, GainLimits.MAX_RX_GAIN, "RX")
-                self.sdr.rx_hardwaregain_chan0 = rx_gain
-            
             if tx_gain is not None:
                 validate_gain(tx_gain, GainLimits.MIN_TX_GAIN, GainLimits.MAX_TX_GAIN, "TX")
-                self.sdr.tx_hardwaregain_chan0 = tx_gain
+        except Exception as e:
+            logger.error(f"Configuration failed: {e}")
+            return False
+        
+        # Write in the order that minimizes intermediate AD9361 retuning:
+        # sample rate, then LOs, then bandwidths, then gains
+        writes = (
+            ('sample_rate', sample_rate),
+            ('rx_lo', rx_lo),
+            ('tx_lo', tx_lo),
+            ('rx_rf_bandwidth', rx_bandwidth),
+            ('tx_rf_bandwidth', tx_bandwidth),
+            ('rx_hardwaregain_chan0', rx_gain),
+            ('tx_hardwaregain_chan0', tx_gain),
+        )
+        
+        try:
+            for attr_name, value in writes:
+                if value is not None:
+                    setattr(self.sdr, attr_name, value)
             
             logger.debug("Device configuration updated successfully")
             return True
@@ -437,29 +725,19 @@ class PlutoSDRDevice:
         reading = TemperatureReading(timestamp=time.time())
         
         try:
-            if hasattr(self.sdr, '_ctx'):
-                ctx = self.sdr._ctx
-                
-                # Try to read AD9361 temperature
+            # Sensor channels are looked up once at connect; only the value is read here
+            if self._ad9361_temp_channel is not None:
                 try:
-                    temp_device = ctx.find_device("ad9361-phy")
-                    if temp_device:
-                        temp_attr = temp_device.find_channel("temp0", False)
-                        if temp_attr and hasattr(temp_attr, 'attrs') and 'input' in temp_attr.attrs:
-                            temp_raw = int(temp_attr.attrs['input'].value)
-                            reading.ad9361 = temp_raw / 1000.0  # Convert millidegrees to degrees
+                    temp_raw = int(self._ad9361_temp_channel.attrs['input'].value)
+                    reading.ad9361 = temp_raw / 1000.0  # Convert millidegrees to degrees
                 except Exception as e:
                     logger.debug(f"Could not read AD9361 temperature: {e}")
-                
-                # Try to read Zynq temperature
+            
+            if self._xadc_temp_channel is not None:
                 try:
-                    zynq_device = ctx.find_device("xadc")
-                    if zynq_device:
-                        temp_attr = zynq_device.find_channel("temp0", False)
-                        if temp_attr and hasattr(temp_attr, 'attrs') and 'raw' in temp_attr.attrs:
-                            temp_raw = int(temp_attr.attrs['raw'].value)
-                            # Zynq temperature conversion (device-specific)
-                            reading.zynq = (temp_raw * 503.975 / 4096) - 273.15
+                    temp_raw = int(self._xadc_temp_channel.attrs['raw'].value)
+                    # Zynq temperature conversion (device-specific)
+                    reading.zynq = (temp_raw * 503.975 / 4096) - 273.15
                 except Exception as e:
                     logger.debug(f"Could not read Zynq temperature: {e}")
             
@@ -523,6 +801,8 @@ class PlutoSDRManager:
     connection management, and basic operations.
     """
 
+    __slots__ = ('device', 'discoverers', '_device_pool', '_device_pool_lock', '_pool_timer')
+
     def __init__(self, uri: Optional[str] = None, auto_discover: bool = True):
         """
         Initialize PlutoSDR manager
@@ -532,6 +812,10 @@ class PlutoSDRManager:
             auto_discover: Whether to auto-discover devices if no URI provided
         """
         self.device: Optional[PlutoSDRDevice] = None
+        # Devices parked by release(), keyed by URI as (timestamp, device)
+        self._device_pool: "OrderedDict[str, Tuple[float, PlutoSDRDevice]]" = OrderedDict()
+        self._device_pool_lock = threading.Lock()
+        self._pool_timer: Optional[threading.Timer] = None
         self.discoverers = [
             USBDiscoverer(),
             IPDiscoverer(),
@@ -571,38 +855,95 @@ class PlutoSDRManager:
         """Get SDR object for direct access"""
         return self.device.sdr if self.device else None
 
-    def discover_devices(self) -> List[DeviceInfo]:
+    def discover_devices(self, force: bool = False) -> List[DeviceInfo]:
         """
         Discover all available PlutoSDR devices
 
+        Results are cached for DeviceDiscovery.CACHE_TTL seconds.
+
+        Args:
+            force: Bypass the cache and rescan
+
         Returns:
             List of discovered device information
         """
-        all_devices = []
+        if force:
+            self.invalidate()
+        else:
+            cached = self._get_cached_devices()
+            if cached is not None:
+                return cached
 
         with PerformanceTimer("Device discovery"):
-            for discoverer in self.discoverers:
-                try:
-                    devices = discoverer.discover()
-                    all_devices.extend(devices)
-                except Exception as e:
-                    logger.debug(f"Discovery method {discoverer.__class__.__name__} failed: {e}")
+            # Run discoverers concurrently; wall time is the slowest method, not the sum
+            executor = ThreadPoolExecutor(max_workers=len(self.discoverers))
+            futures = {executor.submit(discoverer.discover): index
+                       for index, discoverer in enumerate(self.discoverers)}
+            results: Dict[int, List[DeviceInfo]] = {}
+
+            try:
+                for future in as_completed(futures, timeout=DeviceDiscovery.DISCOVERY_TIMEOUT):
+                    discoverer = self.discoverers[futures[future]]
+                    try:
+                        results[futures[future]] = future.result()
+                    except Exception as e:
+                        # A failed method has finished with no devices
+                        logger.debug(f"Discovery method {discoverer.__class__.__name__} failed: {e}")
+                        results[futures[future]] = []
+            except FuturesTimeoutError:
+                logger.debug("Device discovery timed out waiting for slow discovery methods")
+            finally:
+                executor.shutdown(wait=False)
+
+        return self._store_discovered_devices(results)
 
-        # Remove duplicates based on URI
-        unique_devices = []
-        seen_uris = set()
+    def _discovery_cache_key(self) -> Tuple[str, ...]:
+        """Key discovery results by the set of discovery methods used"""
+        return tuple(type(discoverer).__name__ for discoverer in self.discoverers)
+
+    def _get_cached_devices(self) -> Optional[List[DeviceInfo]]:
+        """Get discovery results younger than DeviceDiscovery.CACHE_TTL, if any"""
+        cached = _discovery_cache.get(self._discovery_cache_key())
+        if cached is not None and time.monotonic() - cached[0] < DeviceDiscovery.CACHE_TTL:
+            logger.debug(f"Using cached discovery results ({len(cached[1])} device(s))")
+            return list(cached[1])
+        return None
+
+    def _store_discovered_devices(self, results: Dict[int, List[DeviceInfo]]) -> List[DeviceInfo]:
+        """
+        Merge per-discoverer results, deduplicate them and cache complete results
+
+        Results are only cached when every discoverer finished, so a slow
+        method that timed out is not remembered as having found nothing.
+        """
+        # Keep discoverer priority order (USB, IP, Zeroconf) in the result
+        all_devices = []
+        for index in sorted(results):
+            all_devices.extend(results[index])
 
+        # Remove duplicates based on URI, keeping the first (highest priority) entry
+        devices_by_uri: Dict[str, DeviceInfo] = {}
         for device in all_devices:
-            if device.uri not in seen_uris:
-                unique_devices.append(device)
-                seen_uris.add(device.uri)
+            devices_by_uri.setdefault(device.uri, device)
+        unique_devices = list(devices_by_uri.values())
 
         logger.info(f"Discovered {len(unique_devices)} unique device(s)")
-        return unique_devices
+        if len(results) == len(self.discoverers):
+            _discovery_cache[self._discovery_cache_key()] = (time.monotonic(), unique_devices)
+        return list(unique_devices)
+
+    def invalidate(self) -> None:
+        """Drop cached discovery results so the next discovery rescans"""
+        invalidate_discovery_cache()
 
     def _auto_connect(self) -> None:
         """Auto-discover and connect to first available device"""
-        devices = self.discover_devices()
+        devices = self._get_cached_devices()
+
+        if devices is None:
+            # Nothing cached: connect to devices while discovery is still running
+            self._discover_and_connect()
+            return
 
         if not devices:
             logger.warning("No PlutoSDR devices found during auto-discovery")
@@ -621,6 +962,69 @@ class PlutoSDRManager:
 
         logger.warning("Could not auto-connect to any discovered device")
 
+    def _discover_and_connect(self) -> None:
+        """
+        Run discovery and connect to the best device as soon as it is known
+
+        Discovery methods run concurrently, but candidates are connected one at
+        a time in discoverer priority order (USB, IP, Zeroconf): a method's
+        devices are tried once it has finished and every higher-priority method
+        has finished without yielding a connection.
+        """
+        executor = ThreadPoolExecutor(max_workers=len(self.discoverers))
+        futures = [executor.submit(discoverer.discover) for discoverer in self.discoverers]
+        results: Dict[int, List[DeviceInfo]] = {}
+        attempted_uris = set()
+        deadline = time.monotonic() + DeviceDiscovery.DISCOVERY_TIMEOUT
+
+        try:
+            with PerformanceTimer("Device discovery and connection"):
+                for index, future in enumerate(futures):
+                    discoverer_name = self.discoverers[index].__class__.__name__
+                    try:
+                        results[index] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                    except FuturesTimeoutError:
+                        logger.debug(f"Discovery method {discoverer_name} timed out")
+                        continue
+                    except Exception as e:
+                        # A failed method has finished with no devices
+                        logger.debug(f"Discovery method {discoverer_name} failed: {e}")
+                        results[index] = []
+                        continue
+
+                    # Try this method's devices before any lower-priority method's
+                    for device_info in results[index]:
+                        if device_info.uri in attempted_uris:
+                            continue
+                        attempted_uris.add(device_info.uri)
+                        device = PlutoSDRDevice(device_info)
+                        if self._try_connect(device):
+                            self.device = device
+                            logger.info(f"Auto-connected to device: {device_info.uri}")
+                            break
+
+                    if self.device is not None:
+                        break
+        finally:
+            executor.shutdown(wait=False)
+
+        self._store_discovered_devices(results)
+
+        if self.device is None:
+            if attempted_uris:
+                logger.warning("Could not auto-connect to any discovered device")
+            else:
+                logger.warning("No PlutoSDR devices found during auto-discovery")
+
+    @staticmethod
+    def _try_connect(device: PlutoSDRDevice) -> bool:
+        """Connect a device, reporting failure as False instead of raising"""
+        try:
+            return device.connect()
+        except Exception as e:
+            logger.debug(f"Failed to connect to {device.device_info.uri}: {e}")
+            return False
+
     def connect(self, uri: str) -> bool:
         """
         Connect to a specific device
@@ -634,6 +1038,13 @@ class PlutoSDRManager:
         # Disconnect current device if any
         self.disconnect()
 
+        # Reconnecting to a URI parked by release() reuses its still-open device
+        pooled = self._take_pooled_device(uri)
+        if pooled is not None:
+            logger.debug(f"Reusing pooled connection to {uri}")
+            self.device = pooled
+            return True
+
         device_info = DeviceInfo(uri=uri, connection_type=ConnectionType.AUTO)
         self.device = PlutoSDRDevice(device_info)
 
@@ -650,6 +1061,87 @@ class PlutoSDRManager:
             self.device.disconnect()
             self.device = None
 
+    def release(self) -> None:
+        """
+        Release the current device into this manager's pool instead of closing it
+
+        The device's RX and TX buffers are destroyed before it is parked, so it
+        stops streaming and transmitting. A connect() to the same URI within
+        PerformanceConstants.DEVICE_POOL_IDLE_TIMEOUT reuses the open device;
+        after that it is closed.
+        """
+        if self.device:
+            if self.device.is_connected:
+                self.device.destroy_buffers()
+                self._pool_device(self.device)
+            self.device = None
+
+    def _pool_device(self, device: PlutoSDRDevice) -> None:
+        """Park a connected device in the pool, closing the oldest beyond capacity"""
+        with self._device_pool_lock:
+            previous = self._device_pool.pop(device.device_info.uri, None)
+            self._device_pool[device.device_info.uri] = (time.monotonic(), device)
+            evicted = []
+            if previous is not None and previous[1] is not device:
+                evicted.append(previous[1])
+            while len(self._device_pool) > PerformanceConstants.DEVICE_POOL_SIZE:
+                evicted.append(self._device_pool.popitem(last=False)[1][1])
+            self._schedule_pool_eviction()
+
+        for stale in evicted:
+            stale.disconnect()
+
+    def _schedule_pool_eviction(self) -> None:
+        """Start the idle timer for the oldest pooled device, if not already running"""
+        if self._pool_timer is not None or not self._device_pool:
+            return
+        oldest_pooled_at = next(iter(self._device_pool.values()))[0]
+        delay = max(0.0, oldest_pooled_at + PerformanceConstants.DEVICE_POOL_IDLE_TIMEOUT
+                    - time.monotonic())
+        self._pool_timer = threading.Timer(delay, self._on_pool_timer)
+        self._pool_timer.daemon = True
+        self._pool_timer.start()
+
+    def _on_pool_timer(self) -> None:
+        """Close idle pooled devices and re-arm the timer for the remaining ones"""
+        with self._device_pool_lock:
+            self._pool_timer = None
+        self._evict_idle_devices()
+        with self._device_pool_lock:
+            self._schedule_pool_eviction()
+
+    def _take_pooled_device(self, uri: str) -> Optional[PlutoSDRDevice]:
+        """Take a pooled device for this URI if it is still connected"""
+        self._evict_idle_devices()
+        with self._device_pool_lock:
+            entry = self._device_pool.pop(uri, None)
+        if entry is not None and entry[1].is_connected:
+            return entry[1]
+        return None
+
+    def _evict_idle_devices(self) -> None:
+        """Close pooled devices that have been idle longer than the pool timeout"""
+        now = time.monotonic()
+        with self._device_pool_lock:
+            idle_uris = [uri for uri, (pooled_at, _) in self._device_pool.items()
+                         if now - pooled_at >= PerformanceConstants.DEVICE_POOL_IDLE_TIMEOUT]
+            evicted = [self._device_pool.pop(uri)[1] for uri in idle_uris]
+
+        for device in evicted:
+            device.disconnect()
+
+    def _close_pooled_devices(self) -> None:
+        """Close every pooled device and stop the idle timer"""
+        with self._device_pool_lock:
+            evicted = [device for _, device in self._device_pool.values()]
+            self._device_pool.clear()
+            timer, self._pool_timer = self._pool_timer, None
+        if timer is not None:
+            timer.cancel()
+
+        for device in evicted:
+            device.disconnect()
+
     def configure_basic_settings(self, **kwargs) -> bool:
         """
         Configure basic device settings
@@ -700,10 +1192,12 @@ class PlutoSDRManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - ensure cleanup"""
         self.disconnect()
+        self._close_pooled_devices()
 
     def __del__(self):
         """Destructor - ensure cleanup"""
         try:
             self.disconnect()
+            self._close_pooled_devices()
         except:
             pass  # Ignore errors during cleanup
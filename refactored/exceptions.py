@@ -9,6 +9,7 @@ Author: Enhanced SDR Tools - Refactored
 License: GPL-2 (compatible with original ADI scripts)
 """
 
+import re
 from typing import Optional, Any, Dict
 
 
@@ -340,18 +341,29 @@ class PlotUpdateError(GUIError):
 
 
 # Exception handling utilities
+
+# Classifies device error messages; "not found" anywhere takes precedence
+# over connection/timeout keywords
+_DEVICE_ERROR_RE = re.compile(
+    r'^(?=.*?(?P<not_found>not found))|(?P<connection>connection|timeout)',
+    re.IGNORECASE | re.DOTALL
+)
+
+
 def handle_device_error(func):
     """Decorator to handle common device errors"""
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            if "not found" in str(e).lower():
+            message = str(e)
+            match = _DEVICE_ERROR_RE.search(message)
+            if match is None:
+                raise DeviceError(message) from e
+            elif match.lastgroup == 'not_found':
                 raise DeviceNotFoundError() from e
-            elif "connection" in str(e).lower() or "timeout" in str(e).lower():
-                raise DeviceConnectionError("unknown", str(e)) from e
             else:
-                raise DeviceError(str(e)) from e
+                raise DeviceConnectionError("unknown", message) from e
     return wrapper
 
 
@@ -10,25 +10,107 @@ Author: Enhanced SDR Tools - Refactored
 License: GPL-2 (compatible with original ADI scripts)
 """
 
+import functools
 import logging
 from typing import Tuple, Optional, List, Dict, Any
 from enum import Enum
 
 import numpy as np
+from scipy import fft as sp_fft
 from scipy import signal
 from scipy.signal import find_peaks
 
-from .constants import SignalProcessing, WindowFunction, ValidationRanges
+try:
+    import cupy as cp
+    import cupyx.scipy.fft as cupy_fft
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
+from .constants import SignalProcessing, WindowFunction, VALIDATE_FFT_SIZE, VALIDATE_AVERAGING_FACTOR
 from .exceptions import FFTProcessingError, SpectrumAnalysisError, InvalidParameterError
-from .utils import validate_range, PerformanceTimer
+from .utils import PerformanceTimer
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# scipy.signal window names for each supported window function
+_SCIPY_WINDOW_NAMES = {
+    WindowFunction.HANN.value: 'hann',
+    WindowFunction.HAMMING.value: 'hamming',
+    WindowFunction.BLACKMAN.value: 'blackman',
+    WindowFunction.RECTANGULAR.value: 'boxcar',
+}
+
+# Window name lookup by enum member
+_WINDOW_FUNCTION_NAMES = {window: window.value for window in WindowFunction}
+
+# Amplitude correction factors for different windows
+_CORRECTIONS = {
+    WindowFunction.HANN: 2.0,
+    WindowFunction.HAMMING: 1.85,
+    WindowFunction.BLACKMAN: 2.8,
+    WindowFunction.RECTANGULAR: 1.0
+}
+
+
+@functools.lru_cache(maxsize=len(SignalProcessing.AVAILABLE_FFT_SIZES) * len(WindowFunction))
+def get_window(name: str, n: int) -> np.ndarray:
+    """
+    Get a cached, read-only window array
+    
+    Args:
+        name: Window function name (WindowFunction value)
+        n: Window size
+        
+    Returns:
+        Symmetric float32 window array shared between callers
+    """
+    window = signal.get_window(_SCIPY_WINDOW_NAMES[name], n, fftbins=False).astype(np.float32)
+    window.setflags(write=False)
+    return window
+
+
+def magnitude_db(fft_result: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convert FFT output to a magnitude spectrum in dB
+    
+    Runs in place with numpy ufuncs, which stay in the input precision
+    (float32 for complex64 FFT output).
+    
+    Args:
+        fft_result: Complex FFT output
+        out: Optional real array to write the result into
+        
+    Returns:
+        Magnitude in dB with noise floor protection
+    """
+    if out is None:
+        out = np.empty(fft_result.shape, dtype=fft_result.real.dtype)
+    
+    spectrum_db = np.abs(fft_result, out=out)
+    np.add(spectrum_db, SignalProcessing.NOISE_FLOOR_OFFSET, out=spectrum_db)
+    np.log10(spectrum_db, out=spectrum_db)
+    np.multiply(spectrum_db, 20, out=spectrum_db)
+    return spectrum_db
+
+
+# Shared empty peak arrays for results without detected peaks
+_NO_PEAKS = np.empty(0)
+_NO_PEAKS.setflags(write=False)
+_NO_PEAK_INDICES = np.empty(0, dtype=np.intp)
+_NO_PEAK_INDICES.setflags(write=False)
+
 
 class SpectrumAnalysisResult:
     """Container for spectrum analysis results"""
     
+    __slots__ = (
+        'frequencies', 'spectrum', 'sample_rate', 'fft_size',
+        'peaks_freq', 'peaks_amp', 'peaks_prom', 'peaks_idx',
+        'noise_floor', 'snr', 'dynamic_range', '_peak_cache'
+    )
+    
     def __init__(self, frequencies: np.ndarray, spectrum: np.ndarray, 
                  sample_rate: float, fft_size: int):
         """
@@ -44,19 +126,50 @@ class SpectrumAnalysisResult:
         self.spectrum = spectrum
         self.sample_rate = sample_rate
         self.fft_size = fft_size
-        self.peaks = []
+        
+        # Detected peaks as parallel arrays, highest amplitude first
+        self.peaks_freq = _NO_PEAKS
+        self.peaks_amp = _NO_PEAKS
+        self.peaks_prom = _NO_PEAKS
+        self.peaks_idx = _NO_PEAK_INDICES
+        
         self.noise_floor = None
         self.snr = None
         self.dynamic_range = None
         
+        # Peak detection results keyed by (height_threshold, prominence, distance)
+        self._peak_cache: Dict[Tuple[float, float, int], Tuple[np.ndarray, ...]] = {}
+        
         # Calculate basic metrics
         self._calculate_metrics()
     
+    @property
+    def peaks(self) -> List[Dict[str, float]]:
+        """Detected peaks as a list of dictionaries, highest amplitude first"""
+        return [
+            {
+                'frequency': self.peaks_freq[i],
+                'amplitude': self.peaks_amp[i],
+                'prominence': self.peaks_prom[i],
+                'index': self.peaks_idx[i]
+            }
+            for i in range(len(self.peaks_idx))
+        ]
+    
     def _calculate_metrics(self) -> None:
         """Calculate basic spectrum metrics"""
         if len(self.spectrum) > 0:
-            self.noise_floor = np.percentile(self.spectrum, 10)  # 10th percentile as noise floor
-            self.dynamic_range = np.max(self.spectrum) - np.min(self.spectrum)
+            # 10th percentile as noise floor, interpolated like np.percentile;
+            # partial sort of the two neighbouring ranks via introselect
+            n = len(self.spectrum)
+            pos = 0.1 * (n - 1)
+            k = int(pos)
+            if k + 1 < n:
+                lo, hi = np.partition(self.spectrum, (k, k + 1))[k:k + 2]
+                self.noise_floor = lo + (hi - lo) * (pos - k)
+            else:
+                self.noise_floor = self.spectrum[0]
+            self.dynamic_range = np.ptp(self.spectrum)
     
     def find_peaks(self, height_threshold: Optional[float] = None,
                    prominence: float = SignalProcessing.MIN_PEAK_PROMINENCE,
@@ -64,6 +177,9 @@ class SpectrumAnalysisResult:
         """
         Find peaks in the spectrum
         
+        Results are stored in the peaks_freq, peaks_amp, peaks_prom and
+        peaks_idx arrays.
+        
         Args:
             height_threshold: Minimum peak height (dB). If None, uses noise floor + 20 dB
             prominence: Minimum peak prominence (dB)
@@ -75,6 +191,13 @@ class SpectrumAnalysisResult:
         if height_threshold is None:
             height_threshold = (self.noise_floor or -80) + 20
         
+        # Repeated calls with the same arguments reuse the earlier detection
+        cache_key = (height_threshold, prominence, distance)
+        cached = self._peak_cache.get(cache_key)
+        if cached is not None:
+            self.peaks_freq, self.peaks_amp, self.peaks_prom, self.peaks_idx = cached
+            return self.peaks
+        
         try:
             peak_indices, properties = find_peaks(
                 self.spectrum,
@@ -83,21 +206,19 @@ class SpectrumAnalysisResult:
                 distance=distance
             )
             
-            peaks = []
-            for i, idx in enumerate(peak_indices):
-                peak_info = {
-                    'frequency': self.frequencies[idx],
-                    'amplitude': self.spectrum[idx],
-                    'prominence': properties['prominences'][i],
-                    'index': idx
-                }
-                peaks.append(peak_info)
-            
             # Sort by amplitude (highest first)
-            peaks.sort(key=lambda x: x['amplitude'], reverse=True)
-            self.peaks = peaks
+            amplitudes = self.spectrum[peak_indices]
+            order = np.argsort(-amplitudes, kind='stable')
+            
+            self.peaks_idx = peak_indices[order]
+            self.peaks_amp = amplitudes[order]
+            self.peaks_prom = properties['prominences'][order]
+            self.peaks_freq = self.frequencies[self.peaks_idx]
+            self._peak_cache[cache_key] = (
+                self.peaks_freq, self.peaks_amp, self.peaks_prom, self.peaks_idx
+            )
             
-            return peaks
+            return self.peaks
         
         except Exception as e:
             logger.error(f"Peak detection failed: {e}")
@@ -113,18 +234,27 @@ class SpectrumAnalysisResult:
         Returns:
             Formatted peak summary string
         """
-        if not self.peaks:
+        num_peaks = len(self.peaks_idx)
+        if num_peaks == 0:
             return "No peaks detected"
         
-        summary = f"Detected {len(self.peaks)} peaks:\n"
-        for i, peak in enumerate(self.peaks[:max_peaks]):
-            freq_mhz = peak['frequency'] / 1e6
-            summary += f"  {i+1:2d}. {freq_mhz:8.3f} MHz: {peak['amplitude']:6.1f} dB\n"
+        # Format the listed peaks' numbers in one vectorized call per column
+        shown = min(max_peaks, num_peaks)
+        freq_strs = np.char.mod('%8.3f', self.peaks_freq[:shown] / 1e6)
+        amp_strs = np.char.mod('%6.1f', self.peaks_amp[:shown])
+        
+        lines = [f"Detected {num_peaks} peaks:"]
+        lines.extend(
+            f"  {i+1:2d}. {freq_str} MHz: {amp_str} dB"
+            for i, (freq_str, amp_str) in enumerate(zip(freq_strs, amp_strs))
+        )
         
-        if len(self.peaks) > max_peaks:
-            summary += f"  ... and {len(self.peaks) - max_peaks} more\n"
+        if num_peaks > max_peaks:
+            lines.append(f"  ... and {num_peaks - max_peaks} more")
         
-        return summary
+        # Keep the trailing newline of the original format
+        lines.append("")
+        return "\n".join(lines)
 
 
 class WindowFunctionProcessor:
@@ -142,17 +272,11 @@ class WindowFunctionProcessor:
         Returns:
             Window function array
         """
-        if window_type == WindowFunction.HANN:
-            return np.hanning(size)
-        elif window_type == WindowFunction.HAMMING:
-            return np.hamming(size)
-        elif window_type == WindowFunction.BLACKMAN:
-            return np.blackman(size)
-        elif window_type == WindowFunction.RECTANGULAR:
-            return np.ones(size)
-        else:
+        name = _WINDOW_FUNCTION_NAMES.get(window_type)
+        if name is None:
             logger.warning(f"Unknown window type {window_type}, using Hann")
-            return np.hanning(size)
+            name = WindowFunction.HANN.value
+        return get_window(name, size)
     
     @staticmethod
     def get_window_correction_factor(window_type: WindowFunction) -> float:
@@ -165,38 +289,89 @@ class WindowFunctionProcessor:
         Returns:
             Correction factor
         """
-        # Correction factors for different windows
-        corrections = {
-            WindowFunction.HANN: 2.0,
-            WindowFunction.HAMMING: 1.85,
-            WindowFunction.BLACKMAN: 2.8,
-            WindowFunction.RECTANGULAR: 1.0
-        }
-        return corrections.get(window_type, 2.0)
+        return _CORRECTIONS.get(window_type, 2.0)
+
+
+@functools.lru_cache(maxsize=len(SignalProcessing.AVAILABLE_FFT_SIZES) * len(WindowFunction))
+def get_scaled_windows(window_type: WindowFunction, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get cached, read-only FFT coefficient vectors for a window
+    
+    The window is multiplied by its amplitude correction factor and divided
+    by its sum. For even sizes the second vector also carries alternating
+    signs, which makes the FFT output come out DC-centered.
+    
+    Args:
+        window_type: Type of window function
+        n: Window size
+        
+    Returns:
+        Tuple of (scaled window, scaled window with shift signs)
+    """
+    window = WindowFunctionProcessor.get_window(window_type, n)
+    correction = WindowFunctionProcessor.get_window_correction_factor(window_type)
+    window_scaled = (window * (correction / np.sum(window))).astype(np.float32)
+    window_scaled.setflags(write=False)
+    
+    if n % 2 == 0:
+        window_shifted = window_scaled.copy()
+        window_shifted[1::2] *= -1
+        window_shifted.setflags(write=False)
+    else:
+        window_shifted = window_scaled
+    
+    return window_scaled, window_shifted
 
 
 class FFTProcessor:
     """FFT processing with optimizations and error handling"""
     
     def __init__(self, fft_size: int = SignalProcessing.DEFAULT_FFT_SIZE,
-                 window_type: WindowFunction = SignalProcessing.DEFAULT_WINDOW):
+                 window_type: WindowFunction = SignalProcessing.DEFAULT_WINDOW,
+                 use_gpu: bool = False):
         """
         Initialize FFT processor
         
         Args:
             fft_size: FFT size
             window_type: Window function type
+            use_gpu: Run complex FFTs on the GPU through CuPy when available
         """
-        validate_range(fft_size, ValidationRanges.FFT_SIZE_RANGE[0], 
-                      ValidationRanges.FFT_SIZE_RANGE[1], "fft_size")
+        VALIDATE_FFT_SIZE(fft_size)
         
         self.fft_size = fft_size
         self.window_type = window_type
+        
+        # Public window attributes kept for compatibility; the processing path
+        # only uses the scaled windows below. The window itself is the shared
+        # cached array, so these cost one sum per processor
         self.window = WindowFunctionProcessor.get_window(window_type, fft_size)
         self.window_correction = WindowFunctionProcessor.get_window_correction_factor(window_type)
-        
-        # Pre-calculate window normalization
         self.window_norm = np.sum(self.window)
+        
+        # FFT input buffer reused across frames; scipy.fft caches the plan per size
+        self._fft_input = np.zeros(fft_size, dtype=np.complex64)
+        
+        # Window with correction and normalization folded in, so frames need one multiply;
+        # for even sizes alternating signs shift the FFT output to DC-centered order
+        self._window_scaled, self._window_scaled_shifted = get_scaled_windows(window_type, fft_size)
+        self._needs_shift = fft_size % 2 != 0
+        
+        # Output buffers reused across frames; results hold views of them
+        self._spectrum_db = np.empty(fft_size, dtype=np.float32)
+        self._half_spectrum_db = np.empty(fft_size // 2 + 1, dtype=np.float32)
+        
+        # Shifted frequency axes keyed by sample rate
+        self._frequency_cache: Dict[float, np.ndarray] = {}
+        
+        # Optional GPU backend with device buffers and a persistent cuFFT plan
+        if use_gpu and not CUPY_AVAILABLE:
+            logger.warning("CuPy not available - using CPU FFT")
+        self.use_gpu = use_gpu and CUPY_AVAILABLE
+        if self.use_gpu:
+            self._gpu_input = cp.empty(fft_size, dtype=cp.complex64)
+            self._gpu_window = cp.asarray(self._window_scaled_shifted)
+            self._gpu_plan = cupy_fft.get_fft_plan(self._gpu_input, axes=(0,))
     
     def process_samples(self, samples: np.ndarray, sample_rate: float) -> SpectrumAnalysisResult:
         """
@@ -207,42 +382,120 @@ class FFTProcessor:
             sample_rate: Sample rate in Hz
             
         Returns:
-            SpectrumAnalysisResult object
+            SpectrumAnalysisResult object. Its spectrum is a view of a buffer
+            that the next call overwrites; copy it to keep a snapshot.
             
         Raises:
             FFTProcessingError: If FFT processing fails
         """
+        # Validate inputs
+        if len(samples) == 0:
+            raise FFTProcessingError(0, self.fft_size)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            with PerformanceTimer("FFT processing", logger.debug):
+                return self._compute_spectrum(samples, sample_rate)
+        return self._compute_spectrum(samples, sample_rate)
+    
+    def _compute_spectrum(self, samples: np.ndarray, sample_rate: float) -> SpectrumAnalysisResult:
+        """
+        Compute the spectrum of a non-empty sample frame
+        
+        Args:
+            samples: Complex IQ samples
+            sample_rate: Sample rate in Hz
+            
+        Returns:
+            SpectrumAnalysisResult object
+            
+        Raises:
+            FFTProcessingError: If the samples cannot be transformed
+        """
         try:
-            with PerformanceTimer("FFT processing"):
-                # Validate inputs
-                if len(samples) == 0:
-                    raise FFTProcessingError(0, self.fft_size)
-                
-                # Prepare samples
-                processed_samples = self._prepare_samples(samples)
-                
-                # Apply window
-                windowed_samples = processed_samples * self.window
-                
-                # Compute FFT
-                fft_result = np.fft.fftshift(np.fft.fft(windowed_samples, self.fft_size))
-                
-                # Convert to magnitude spectrum in dB
-                magnitude = np.abs(fft_result)
-                
-                # Apply window correction and normalization
-                magnitude = magnitude * self.window_correction / self.window_norm
-                
-                # Convert to dB with noise floor protection
-                spectrum_db = 20 * np.log10(magnitude + SignalProcessing.NOISE_FLOOR_OFFSET)
-                
-                # Generate frequency axis
-                frequencies = np.fft.fftshift(np.fft.fftfreq(self.fft_size, 1/sample_rate))
-                
-                return SpectrumAnalysisResult(frequencies, spectrum_db, sample_rate, self.fft_size)
+            # Prepare samples
+            processed_samples = self._prepare_samples(samples)
+            
+            # Magnitude spectrum in dB centered on DC
+            if np.iscomplexobj(processed_samples) and self.use_gpu:
+                spectrum_db = self._compute_spectrum_gpu(processed_samples)
+                if self._needs_shift:
+                    spectrum_db = np.fft.fftshift(spectrum_db)
+            elif np.iscomplexobj(processed_samples):
+                # Apply scaled window into the reusable input buffer and compute FFT
+                np.multiply(processed_samples, self._window_scaled_shifted, out=self._fft_input)
+                fft_result = sp_fft.fft(self._fft_input, overwrite_x=True)
+                spectrum_db = magnitude_db(fft_result, out=self._spectrum_db)
+                if self._needs_shift:
+                    spectrum_db = np.fft.fftshift(spectrum_db)
+            else:
+                # Real input: rfft computes half the spectrum, the other half mirrors it
+                half_spectrum_db = magnitude_db(
+                    sp_fft.rfft(processed_samples * self._window_scaled),
+                    out=self._half_spectrum_db
+                )
+                spectrum_db = self._mirror_real_spectrum(half_spectrum_db, out=self._spectrum_db)
         
-        except Exception as e:
+        except (ValueError, FloatingPointError) as e:
             raise FFTProcessingError(len(samples), self.fft_size) from e
+        
+        # Frequency axis for this sample rate
+        frequencies = self._get_frequencies(sample_rate)
+        
+        return SpectrumAnalysisResult(frequencies, spectrum_db, sample_rate, self.fft_size)
+    
+    def _compute_spectrum_gpu(self, processed_samples: np.ndarray) -> np.ndarray:
+        """
+        Compute the dB spectrum of a complex frame on the GPU
+        
+        Args:
+            processed_samples: Prepared complex64 samples of fft_size
+            
+        Returns:
+            Magnitude spectrum in dB, copied into the host output buffer
+        """
+        self._gpu_input.set(processed_samples)
+        self._gpu_input *= self._gpu_window
+        fft_result = cupy_fft.fft(self._gpu_input, overwrite_x=True, plan=self._gpu_plan)
+        
+        spectrum_db = cp.abs(fft_result)
+        cp.add(spectrum_db, SignalProcessing.NOISE_FLOOR_OFFSET, out=spectrum_db)
+        cp.log10(spectrum_db, out=spectrum_db)
+        cp.multiply(spectrum_db, 20, out=spectrum_db)
+        return spectrum_db.get(out=self._spectrum_db)
+    
+    def _mirror_real_spectrum(self, half_spectrum: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """
+        Expand an rfft magnitude spectrum to the full FFT length
+        
+        Args:
+            half_spectrum: Magnitude spectrum of bins 0..fft_size//2
+            out: Array of fft_size elements to write into
+            
+        Returns:
+            Spectrum for all fft_size bins, centered on DC
+        """
+        # For real input |X[-k]| == |X[k]|, so negative bins read the half in reverse
+        center = self.fft_size // 2
+        out[:center] = half_spectrum[center:0:-1]
+        out[center:] = half_spectrum[:(self.fft_size + 1) // 2]
+        return out
+    
+    def _get_frequencies(self, sample_rate: float) -> np.ndarray:
+        """
+        Get the shifted frequency axis for a sample rate, computing it once
+        
+        Args:
+            sample_rate: Sample rate in Hz
+            
+        Returns:
+            Read-only frequency array in Hz
+        """
+        frequencies = self._frequency_cache.get(sample_rate)
+        if frequencies is None:
+            frequencies = np.fft.fftshift(np.fft.fftfreq(self.fft_size, 1/sample_rate))
+            frequencies.setflags(write=False)
+            self._frequency_cache[sample_rate] = frequencies
+        return frequencies
     
     def _prepare_samples(self, samples: np.ndarray) -> np.ndarray:
         """
@@ -254,22 +507,18 @@ class FFTProcessor:
         Returns:
             Prepared samples array
         """
-        # Ensure complex data type
-        if not np.iscomplexobj(samples):
-            # Convert real samples to complex
-            samples = samples.astype(np.complex64)
+        # Single precision throughout: complex64 for IQ, float32 for real samples
+        dtype = np.complex64 if np.iscomplexobj(samples) else np.float32
         
         # Handle sample count vs FFT size
         if len(samples) < self.fft_size:
             # Zero-pad if too few samples
-            padded = np.zeros(self.fft_size, dtype=samples.dtype)
+            padded = np.zeros(self.fft_size, dtype=dtype)
             padded[:len(samples)] = samples
             return padded
-        elif len(samples) > self.fft_size:
-            # Take first N samples if too many
-            return samples[:self.fft_size]
         else:
-            return samples
+            # Take first N samples if too many
+            return np.ascontiguousarray(samples[:self.fft_size], dtype=dtype)
 
 
 class SpectrumAnalyzer:
@@ -286,12 +535,12 @@ class SpectrumAnalyzer:
             window_type: Window function type
             averaging_factor: Exponential averaging factor (0-1)
         """
+        VALIDATE_AVERAGING_FACTOR(averaging_factor)
+        
         self.fft_processor = FFTProcessor(fft_size, window_type)
         self.averaging_factor = averaging_factor
         self.averaged_spectrum = None
         self.peak_hold_spectrum = None
-        
-        validate_range(averaging_factor, 0.0, 1.0, "averaging_factor")
     
     def analyze_samples(self, samples: np.ndarray, sample_rate: float,
                        enable_averaging: bool = True,
@@ -306,7 +555,9 @@ class SpectrumAnalyzer:
             enable_peak_hold: Whether to update peak hold
             
         Returns:
-            SpectrumAnalysisResult object
+            SpectrumAnalysisResult object. Its spectrum is a view of a buffer
+            that the next call overwrites (read-only when averaging); copy it
+            to keep a snapshot.
         """
         # Process samples
         result = self.fft_processor.process_samples(samples, sample_rate)
@@ -316,17 +567,24 @@ class SpectrumAnalyzer:
             if self.averaged_spectrum is None:
                 self.averaged_spectrum = result.spectrum.copy()
             else:
+                # Update the running average in place; the frame's own spectrum
+                # is replaced by the average, so it can be scaled in place too
                 alpha = self.averaging_factor
-                self.averaged_spectrum = (alpha * result.spectrum + 
-                                        (1 - alpha) * self.averaged_spectrum)
-                result.spectrum = self.averaged_spectrum.copy()
+                np.multiply(self.averaged_spectrum, 1 - alpha, out=self.averaged_spectrum)
+                np.multiply(result.spectrum, alpha, out=result.spectrum)
+                np.add(self.averaged_spectrum, result.spectrum, out=self.averaged_spectrum)
+            
+            # Read-only view, so callers cannot corrupt the averaging state
+            averaged_view = self.averaged_spectrum.view()
+            averaged_view.setflags(write=False)
+            result.spectrum = averaged_view
         
         # Update peak hold if enabled
         if enable_peak_hold:
             if self.peak_hold_spectrum is None:
                 self.peak_hold_spectrum = result.spectrum.copy()
             else:
-                self.peak_hold_spectrum = np.maximum(self.peak_hold_spectrum, result.spectrum)
+                np.maximum(self.peak_hold_spectrum, result.spectrum, out=self.peak_hold_spectrum)
         
         return result
     
@@ -363,21 +621,20 @@ class SpectrumAnalyzer:
 
             # Find frequency bin closest to signal frequency
             freq_resolution = result.sample_rate / result.fft_size
+            num_bins = len(result.spectrum)
 
-            # Convert signal frequency to relative frequency (centered around 0)
-            relative_signal_freq = signal_frequency
-
-            # Find the closest frequency bin
-            freq_diff = np.abs(result.frequencies - relative_signal_freq)
-            signal_bin = np.argmin(freq_diff)
+            # The DC-centered grid is uniform, so the closest bin follows directly
+            # from the signal frequency (relative to center)
+            signal_bin = result.fft_size // 2 + int(round(signal_frequency / freq_resolution))
+            signal_bin = min(max(signal_bin, 0), num_bins - 1)
 
             # Define signal region (±bandwidth/2 around signal)
             bandwidth_bins = max(1, int(signal_bandwidth / freq_resolution))
             signal_start = max(0, signal_bin - bandwidth_bins // 2)
-            signal_end = min(len(result.spectrum), signal_bin + bandwidth_bins // 2 + 1)
+            signal_end = min(num_bins, signal_bin + bandwidth_bins // 2 + 1)
 
             # Ensure we have valid signal region
-            if signal_start >= signal_end or signal_end > len(result.spectrum):
+            if signal_start >= signal_end or signal_end > num_bins:
                 logger.warning("Invalid signal region for SNR estimation")
                 return None
 
@@ -390,15 +647,13 @@ class SpectrumAnalyzer:
             signal_power = np.max(signal_region)
 
             # Calculate noise power (exclude signal region)
-            noise_mask = np.ones(len(result.spectrum), dtype=bool)
-            noise_mask[signal_start:signal_end] = False
-
-            noise_region = result.spectrum[noise_mask]
-            if len(noise_region) == 0:
+            noise_count = signal_start + (num_bins - signal_end)
+            if noise_count == 0:
                 logger.warning("Empty noise region for SNR estimation")
                 return None
 
-            noise_power = np.mean(noise_region)
+            noise_power = (np.sum(result.spectrum[:signal_start]) +
+                           np.sum(result.spectrum[signal_end:])) / noise_count
 
             snr = signal_power - noise_power
             return snr
@@ -435,7 +690,7 @@ def estimate_snr(samples: np.ndarray, signal_frequency: float, sample_rate: floa
     Estimate SNR from IQ samples (backward compatibility function)
 
     Args:
-        samples: Complex IQ samples
+        samples: Complex IQ samples, or real samples such as test tones
         signal_frequency: Expected signal frequency in Hz (relative to center)
         sample_rate: Sample rate in Hz
         signal_bandwidth: Signal bandwidth in Hz
@@ -444,6 +699,7 @@ def estimate_snr(samples: np.ndarray, signal_frequency: float, sample_rate: floa
         Estimated SNR in dB, or None if calculation fails
     """
     try:
+        # Real samples take FFTProcessor's rfft path, which computes only N/2+1 bins
         analyzer = SpectrumAnalyzer()
         result = analyzer.analyze_samples(samples, sample_rate, enable_averaging=False)
 
@@ -12,9 +12,12 @@ License: GPL-2 (compatible with original ADI scripts)
 
 import re
 import time
+import threading
 import logging
 import functools
-from typing import Union, Optional, Tuple, List, Any, Callable
+from collections import deque
+from itertools import chain
+from typing import Union, Optional, Tuple, List, Any, Callable, Iterator
 from pathlib import Path
 
 import numpy as np
@@ -27,6 +30,7 @@ from .exceptions import InvalidParameterError
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
 def format_frequency(freq_hz: float) -> str:
     """
     Format frequency for human-readable display
@@ -53,6 +57,19 @@ def format_frequency(freq_hz: float) -> str:
         return f"{freq_hz:.1f} Hz"
 
 
+# Number with optional unit, e.g. "2.4 GHz" or "100M"
+_FREQUENCY_RE = re.compile(r'^(\d+(?:\.\d+)?)\s*(GHZ|G|MHZ|M|KHZ|K|HZ|H)?$', re.IGNORECASE)
+
+# Hz multiplier for each unit accepted by _FREQUENCY_RE
+_FREQUENCY_UNIT_MULTIPLIERS = {
+    'GHZ': UnitConversion.GHZ_TO_HZ, 'G': UnitConversion.GHZ_TO_HZ,
+    'MHZ': UnitConversion.MHZ_TO_HZ, 'M': UnitConversion.MHZ_TO_HZ,
+    'KHZ': 1e3, 'K': 1e3,
+    'HZ': 1.0, 'H': 1.0, '': 1.0,
+}
+
+
+@functools.lru_cache(maxsize=64)
 def parse_frequency(freq_str: str) -> float:
     """
     Parse frequency string to Hz
@@ -72,27 +89,17 @@ def parse_frequency(freq_str: str) -> float:
         >>> parse_frequency("100 MHz")
         100000000.0
     """
-    freq_str = freq_str.strip().upper()
-    
-    # Regular expression to match number and optional unit
-    pattern = r'^(\d+(?:\.\d+)?)\s*(GHZ|G|MHZ|M|KHZ|K|HZ|H)?$'
-    match = re.match(pattern, freq_str)
+    freq_str = freq_str.strip()
+    match = _FREQUENCY_RE.match(freq_str)
     
     if not match:
-        raise InvalidParameterError("frequency", freq_str, "number with optional unit (GHz, MHz, kHz, Hz)")
+        raise InvalidParameterError("frequency", freq_str.upper(), "number with optional unit (GHz, MHz, kHz, Hz)")
     
     value = float(match.group(1))
-    unit = match.group(2) or ""
+    unit = (match.group(2) or "").upper()
     
     # Convert to Hz based on unit
-    if unit in ['GHZ', 'G']:
-        return value * UnitConversion.GHZ_TO_HZ
-    elif unit in ['MHZ', 'M']:
-        return value * UnitConversion.MHZ_TO_HZ
-    elif unit in ['KHZ', 'K']:
-        return value * 1e3
-    else:  # Hz or no unit
-        return value
+    return value * _FREQUENCY_UNIT_MULTIPLIERS[unit]
 
 
 def format_time_duration(seconds: float) -> str:
@@ -124,6 +131,7 @@ def format_time_duration(seconds: float) -> str:
         return f"{seconds:.1f}s"
 
 
+@functools.lru_cache(maxsize=256)
 def format_data_size(bytes_size: int) -> str:
     """
     Format data size for human-readable display
@@ -159,7 +167,10 @@ def clamp(value: float, min_value: float, max_value: float) -> float:
     Returns:
         Clamped value
     """
-    return max(min_value, min(value, max_value))
+    # Conditional expressions instead of min()/max() calls; min_value wins
+    # when the range is inverted, as before
+    value = max_value if value > max_value else value
+    return min_value if value < min_value else value
 
 
 def linear_interpolate(x: float, x1: float, y1: float, x2: float, y2: float) -> float:
@@ -203,9 +214,16 @@ def moving_average(data: np.ndarray, window_size: int) -> np.ndarray:
     if window_size <= 1:
         return data
     
-    # Use convolution for efficient moving average
-    kernel = np.ones(window_size) / window_size
-    return np.convolve(data, kernel, mode='same')
+    # Boxcar sums from a running cumulative sum over zero-padded data;
+    # equivalent to np.convolve(data, ones/window_size, mode='same') in O(N)
+    data = np.asarray(data)
+    n = len(data)
+    padded = np.pad(data, window_size - 1)
+    cumsum = np.cumsum(np.concatenate(([0], padded)))
+    full = (cumsum[window_size:] - cumsum[:-window_size]) / window_size
+    
+    start = (min(n, window_size) - 1) // 2
+    return full[start:start + max(n, window_size)]
 
 
 def find_peaks_simple(data: np.ndarray, threshold: float, min_distance: int = 1) -> List[int]:
@@ -220,16 +238,24 @@ def find_peaks_simple(data: np.ndarray, threshold: float, min_distance: int = 1)
     Returns:
         List of peak indices
     """
-    peaks = []
+    data = np.asarray(data)
+    if len(data) < 3:
+        return []
     
-    for i in range(1, len(data) - 1):
-        if (data[i] > threshold and 
-            data[i] > data[i-1] and 
-            data[i] > data[i+1]):
-            
-            # Check minimum distance from previous peaks
-            if not peaks or i - peaks[-1] >= min_distance:
-                peaks.append(i)
+    # Local maxima above threshold, compared against both neighbours at once
+    center = data[1:-1]
+    candidates = np.flatnonzero(
+        (center > threshold) & (center > data[:-2]) & (center > data[2:])
+    ) + 1
+    
+    if min_distance <= 1:
+        return candidates.tolist()
+    
+    # Check minimum distance from previous peaks (only over the candidates)
+    peaks = []
+    for i in candidates.tolist():
+        if not peaks or i - peaks[-1] >= min_distance:
+            peaks.append(i)
     
     return peaks
 
@@ -281,6 +307,11 @@ def timeout_after(seconds: float) -> Callable:
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            # SIGALRM handlers can only be installed from the main thread
+            if threading.current_thread() is not threading.main_thread():
+                logger.debug(f"Timeout not supported off the main thread, executing {func.__name__} without timeout")
+                return func(*args, **kwargs)
+
             try:
                 import signal
 
@@ -372,7 +403,22 @@ def get_timestamp_string(include_microseconds: bool = False) -> str:
         return time.strftime("%Y%m%d_%H%M%S")
 
 
-def chunks(lst: List[Any], chunk_size: int) -> List[List[Any]]:
+def chunks(lst: List[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """
+    Split list into chunks of specified size, yielding one chunk at a time
+    
+    Args:
+        lst: Input list
+        chunk_size: Size of each chunk
+        
+    Yields:
+        Consecutive chunks of lst
+    """
+    for i in range(0, len(lst), chunk_size):
+        yield lst[i:i + chunk_size]
+
+
+def chunks_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
     """
     Split list into chunks of specified size
     
@@ -383,7 +429,7 @@ def chunks(lst: List[Any], chunk_size: int) -> List[List[Any]]:
     Returns:
         List of chunks
     """
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+    return list(chunks(lst, chunk_size))
 
 
 def flatten_list(nested_list: List[List[Any]]) -> List[Any]:
@@ -396,7 +442,7 @@ def flatten_list(nested_list: List[List[Any]]) -> List[Any]:
     Returns:
         Flattened list
     """
-    return [item for sublist in nested_list for item in sublist]
+    return list(chain.from_iterable(nested_list))
 
 
 class PerformanceTimer:
@@ -405,23 +451,23 @@ class PerformanceTimer:
     def __init__(self, name: str = "Operation", logger_func: Optional[Callable] = None):
         self.name = name
         self.logger_func = logger_func or logger.info
-        self.start_time = None
+        self.start_time = None  # perf_counter_ns() timestamps
         self.end_time = None
     
     def __enter__(self):
-        self.start_time = time.perf_counter()
+        self.start_time = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.end_time = time.perf_counter()
-        duration = self.end_time - self.start_time
+        self.end_time = time.perf_counter_ns()
+        duration = (self.end_time - self.start_time) * 1e-9
         self.logger_func(f"{self.name} completed in {duration:.3f}s")
     
     @property
     def duration(self) -> Optional[float]:
-        """Get duration if measurement is complete"""
-        if self.start_time and self.end_time:
-            return self.end_time - self.start_time
+        """Get duration in seconds if measurement is complete"""
+        if self.start_time is not None and self.end_time is not None:
+            return (self.end_time - self.start_time) * 1e-9
         return None
 
 
@@ -438,27 +484,29 @@ class RateLimiter:
         """
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls = []
+        self._time_window_ns = int(time_window * 1e9)
+        self.calls = deque()  # monotonic_ns timestamps, oldest first
     
     def can_proceed(self) -> bool:
         """Check if operation can proceed without exceeding rate limit"""
-        now = time.time()
+        cutoff = time.monotonic_ns() - self._time_window_ns
         
         # Remove old calls outside the time window
-        self.calls = [call_time for call_time in self.calls if now - call_time < self.time_window]
+        while self.calls and self.calls[0] <= cutoff:
+            self.calls.popleft()
         
         return len(self.calls) < self.max_calls
     
     def record_call(self) -> None:
         """Record a call for rate limiting"""
-        self.calls.append(time.time())
+        self.calls.append(time.monotonic_ns())
     
     def wait_if_needed(self) -> None:
         """Wait if necessary to respect rate limit"""
         if not self.can_proceed():
             # Calculate how long to wait
-            oldest_call = min(self.calls)
-            wait_time = self.time_window - (time.time() - oldest_call)
+            oldest_call = self.calls[0]
+            wait_time = (self._time_window_ns - (time.monotonic_ns() - oldest_call)) / 1e9
             if wait_time > 0:
                 time.sleep(wait_time)
         
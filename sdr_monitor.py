@@ -5,31 +5,169 @@ Real-time monitoring with continuous updates and multiple panels
 """
 
 import numpy as np
+from scipy import fft as sp_fft
 import time
 import os
 import sys
 import threading
+from collections import deque
 from datetime import datetime
+from itertools import islice
 import adi
 import json
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _spectrum_metrics_numpy(fft_data, samples, power_db):
+    """Fill power_db (FFT bin order) and return peak power, peak bin, mean power and RMS"""
+    # 10*log10(|X|^2) equals 20*log10(|X|) without taking the square root
+    np.multiply(fft_data.real, fft_data.real, out=power_db)
+    power_db += fft_data.imag * fft_data.imag
+    power_db += 1e-24
+    np.log10(power_db, out=power_db)
+    power_db *= 10
+    peak_idx = int(np.argmax(power_db))
+    rms = np.sqrt(np.mean(np.abs(samples)**2))
+    return power_db[peak_idx], peak_idx, np.mean(power_db), rms
+
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def _spectrum_metrics(fft_data, samples, power_db):
+        """Single-pass version of _spectrum_metrics_numpy"""
+        n = fft_data.shape[0]
+        peak_power = 0.0
+        peak_idx = 0
+        total = 0.0
+        for i in range(n):
+            v = fft_data[i]
+            p = 10.0 * np.log10(v.real * v.real + v.imag * v.imag + 1e-24)
+            power_db[i] = p
+            total += p
+            if i == 0 or p > peak_power:
+                peak_power = p
+                peak_idx = i
+        
+        sum_sq = 0.0
+        for s in samples:
+            sum_sq += s.real * s.real + s.imag * s.imag
+        return peak_power, peak_idx, total / n, np.sqrt(sum_sq / samples.shape[0])
+else:
+    _spectrum_metrics = _spectrum_metrics_numpy
+
+
+def _synthesize_numpy(out, fs, f1, f2, f3, noise, noise_level):
+    """Write three tones at 0.6/0.4/0.3 amplitude plus scaled centered noise into out"""
+    t = np.arange(len(out)) / fs
+    sig1 = 0.6 * np.exp(1j * 2 * np.pi * f1 * t)
+    sig2 = 0.4 * np.exp(1j * 2 * np.pi * f2 * t)
+    sig3 = 0.3 * np.exp(1j * 2 * np.pi * f3 * t)
+    out[:] = sig1 + sig2 + sig3 + (noise - (0.5 + 0.5j)) * noise_level
+
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def _synthesize(out, fs, f1, f2, f3, noise, noise_level):
+        """Single-pass version of _synthesize_numpy"""
+        w1 = 2 * np.pi * f1 / fs
+        w2 = 2 * np.pi * f2 / fs
+        w3 = 2 * np.pi * f3 / fs
+        for i in range(out.shape[0]):
+            re = 0.6 * np.cos(w1 * i) + 0.4 * np.cos(w2 * i) + 0.3 * np.cos(w3 * i)
+            im = 0.6 * np.sin(w1 * i) + 0.4 * np.sin(w2 * i) + 0.3 * np.sin(w3 * i)
+            n = noise[i]
+            out[i] = complex(re + (n.real - 0.5) * noise_level, im + (n.imag - 0.5) * noise_level)
+else:
+    _synthesize = _synthesize_numpy
+
+
+# Waterfall shading: values above each level use the next darker character
+WATERFALL_LEVELS = np.array([0.2, 0.4, 0.6, 0.8])
+WATERFALL_CHARS = np.array([" ", "░", "▒", "▓", "█"])
+
+
 class SDRMonitor:
+    # Static frame elements
+    CLEAR = '\033[2J\033[H'
+    BAR_HEAVY = "═" * 120
+    BAR_LIGHT = "─" * 120
+    
     def __init__(self):
         """Initialize SDR monitor"""
         self.sdr = None
         self.running = False
         self.width = 120  # Wider display like nvtop
-        self.spectrum_history = []
-        self.power_history = []
-        self.snr_history = []
-        self.temp_history = []
         self.max_history = 100
+        self.spectrum_history = deque(maxlen=self.max_history)
+        self.power_history = deque(maxlen=self.max_history)
+        self.snr_history = deque(maxlen=self.max_history)
+        self.temp_history = deque(maxlen=self.max_history)
         self.update_interval = 0.1  # 10 FPS like nvtop
         self.session_start = time.time()
+        self._ts_cache = (None, "")  # (whole second, formatted header timestamp)
+        self._fft_input = None  # complex64 FFT input buffer, sized on first frame
+        self._display_indices = {}  # (bins, columns) -> FFT bin per display column
+        self._spectrum_ring = None  # (max_history, bins) float32 rows backing spectrum_history
+        self._ring_pos = 0
+        self._freq_key = None  # (bins, sample_rate, center_freq) of the cached axis
+        self._actual_freqs = None
+        self._rng = np.random.default_rng()  # synthetic data and simulated temperature
+        self._noise_buf = np.empty(2 * 1024)  # interleaved I/Q uniform noise
+        self._synthetic = np.empty(1024, dtype=np.complex64)  # synthetic frame buffer
         
     def clear_screen(self):
         """Clear screen and move cursor to top"""
-        print('\033[2J\033[H', end='', flush=True)
+        sys.stdout.write(self.CLEAR)
+        sys.stdout.flush()
+        
+    def timestamp(self):
+        """Header timestamp, formatted at most once per second"""
+        now = time.time()
+        second = int(now)
+        if self._ts_cache[0] != second:
+            self._ts_cache = (second, datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S"))
+        return self._ts_cache[1]
+        
+    def display_indices(self, n, count):
+        """FFT bin indices for up to count evenly spaced columns in DC-centered order"""
+        indices = self._display_indices.get((n, count))
+        if indices is None:
+            if n > count:
+                positions = np.linspace(0, n - 1, count, dtype=int)
+            else:
+                positions = np.arange(n)
+            # Position j of the fftshifted spectrum is bin (j - n//2) mod n
+            indices = (positions + n - n // 2) % n
+            self._display_indices[(n, count)] = indices
+        return indices
+        
+    def next_spectrum_row(self, n):
+        """Next row of the preallocated spectrum ring; the oldest history entry is reused"""
+        if self._spectrum_ring is None or self._spectrum_ring.shape[1] != n:
+            self._spectrum_ring = np.empty((self.max_history, n), dtype=np.float32)
+            self._ring_pos = 0
+        row = self._spectrum_ring[self._ring_pos]
+        self._ring_pos = (self._ring_pos + 1) % self.max_history
+        return row
+        
+    def frequency_axis(self, n, sample_rate, center_freq):
+        """Absolute frequency axis in MHz (FFT bin order), recomputed only when tuning changes"""
+        key = (n, sample_rate, center_freq)
+        if key != self._freq_key:
+            # Spectra stay in FFT bin order; the display applies the shift when sampling columns
+            freqs = np.fft.fftfreq(n, 1/sample_rate)
+            self._actual_freqs = (center_freq + freqs) / 1e6
+            self._freq_key = key
+        return self._actual_freqs
+        
+    def recent(self, history, count):
+        """Return the last count entries of a history deque as a list"""
+        return list(islice(history, max(0, len(history) - count), None))
         
     def connect_sdr(self):
         """Connect to PlutoSDR"""
@@ -49,51 +187,56 @@ class SDRMonitor:
         """Get SDR data or generate synthetic"""
         try:
             if self.sdr:
-                samples = self.sdr.rx()
+                # 12-bit ADC data fits comfortably in single precision
+                samples = self.sdr.rx().astype(np.complex64, copy=False)
                 return samples, self.sdr.sample_rate, self.sdr.rx_lo
             else:
                 # Dynamic synthetic data
-                N = 1024
                 fs = 2.4e6
-                t = np.arange(N) / fs
                 
                 # Time-varying signal with multiple components
                 time_factor = time.time() % 20
                 
                 # Multiple signal components
-                sig1 = 0.6 * np.exp(1j * 2 * np.pi * (1e6 + 0.3e6 * np.sin(time_factor)) * t)
-                sig2 = 0.4 * np.exp(1j * 2 * np.pi * (0.5e6 + 0.2e6 * np.cos(time_factor * 1.5)) * t)
-                sig3 = 0.3 * np.exp(1j * 2 * np.pi * (-0.8e6 + 0.1e6 * np.sin(time_factor * 2)) * t)
+                f1 = 1e6 + 0.3e6 * np.sin(time_factor)
+                f2 = 0.5e6 + 0.2e6 * np.cos(time_factor * 1.5)
+                f3 = -0.8e6 + 0.1e6 * np.sin(time_factor * 2)
                 
                 # Dynamic noise level
                 noise_level = 0.05 + 0.03 * np.sin(time_factor * 0.5)
-                noise = (np.random.random(N) + 1j * np.random.random(N) - 0.5 - 0.5j) * noise_level
+                self._rng.random(out=self._noise_buf)
                 
-                samples = sig1 + sig2 + sig3 + noise
-                return samples, fs, 2.4e9
+                # Tones and noise written straight into the reused frame buffer
+                _synthesize(self._synthetic, fs, f1, f2, f3,
+                            self._noise_buf.view(np.complex128), noise_level)
+                return self._synthetic, fs, 2.4e9
         except Exception:
             # Fallback
             N = 1024
-            samples = np.random.random(N) + 1j * np.random.random(N)
+            samples = self._rng.random(2 * N, dtype=np.float32).view(np.complex64)
             return samples, 2.4e6, 2.4e9
             
     def analyze_spectrum(self, samples, sample_rate, center_freq):
         """Analyze spectrum and extract metrics"""
-        # FFT analysis
-        fft_data = np.fft.fftshift(np.fft.fft(samples))
-        freqs = np.fft.fftshift(np.fft.fftfreq(len(samples), 1/sample_rate))
-        power_db = 20 * np.log10(np.abs(fft_data) + 1e-12)
-        actual_freqs = (center_freq + freqs) / 1e6
-        
-        # Calculate metrics
-        peak_power = np.max(power_db)
-        avg_power = np.mean(power_db)
-        noise_floor = np.percentile(power_db, 10)
+        # FFT analysis; dB conversion, peak, mean and RMS in one pass
+        if self._fft_input is None or len(self._fft_input) != len(samples):
+            self._fft_input = np.empty(len(samples), dtype=np.complex64)
+        self._fft_input[:] = samples
+        fft_data = sp_fft.fft(self._fft_input, overwrite_x=True)
+        power_db = self.next_spectrum_row(len(samples))
+        peak_power, peak_idx, avg_power, rms = _spectrum_metrics(fft_data, samples, power_db)
+        actual_freqs = self.frequency_axis(len(samples), sample_rate, center_freq)
+        
+        # Calculate metrics (interpolated 10th percentile noise floor via partial sort)
+        pos = 0.1 * (len(power_db) - 1)
+        k = int(pos)
+        k_next = min(k + 1, len(power_db) - 1)
+        ranked = np.partition(power_db, (k, k_next))
+        noise_floor = ranked[k] + (ranked[k_next] - ranked[k]) * (pos - k)
         snr = peak_power - noise_floor
-        peak_freq = actual_freqs[np.argmax(power_db)]
+        peak_freq = actual_freqs[peak_idx]
         
         # Signal quality metrics
-        rms = np.sqrt(np.mean(np.abs(samples)**2))
         peak_to_avg = peak_power - avg_power
         
         # Store history
@@ -102,13 +245,8 @@ class SDRMonitor:
         self.snr_history.append(snr)
         
         # Simulate temperature (would be real from device)
-        temp = 45 + 10 * np.sin(time.time() * 0.1) + np.random.normal(0, 1)
+        temp = 45 + 10 * np.sin(time.time() * 0.1) + self._rng.normal(0, 1)
         self.temp_history.append(temp)
-        
-        # Limit history
-        for hist in [self.spectrum_history, self.power_history, self.snr_history, self.temp_history]:
-            if len(hist) > self.max_history:
-                hist.pop(0)
                 
         return {
             'freqs': actual_freqs,
@@ -157,14 +295,10 @@ class SDRMonitor:
         lines = []
         lines.append(f"┌─ Real-Time Spectrum " + "─" * (width - 20) + "┐")
         
-        # Downsample for display
-        if len(power_db) > width - 2:
-            indices = np.linspace(0, len(power_db) - 1, width - 2, dtype=int)
-            display_power = power_db[indices]
-            display_freqs = freqs[indices]
-        else:
-            display_power = power_db
-            display_freqs = freqs
+        # Downsample for display (in DC-centered order)
+        indices = self.display_indices(len(power_db), width - 2)
+        display_power = power_db[indices]
+        display_freqs = freqs[indices]
             
         # Normalize for display
         min_power = np.min(display_power)
@@ -175,18 +309,13 @@ class SDRMonitor:
         else:
             norm_power = np.zeros_like(display_power)
             
-        # Create spectrum plot
-        for row in range(height - 1, -1, -1):
-            line = "│"
-            for col, val in enumerate(norm_power):
-                if int(val) == row:
-                    line += "█"
-                elif int(val) > row:
-                    line += "│"
-                else:
-                    line += " "
-            line += "│"
-            lines.append(line)
+        # Create spectrum plot: one character grid, top row first
+        levels = norm_power.astype(int)
+        rows = np.arange(height - 1, -1, -1)[:, np.newaxis]
+        grid = np.full((height, len(levels)), " ")
+        grid[levels > rows] = "│"
+        grid[levels == rows] = "█"
+        lines.extend("│" + "".join(row_chars) + "│" for row_chars in grid)
             
         # Add frequency labels
         freq_line = f"│{display_freqs[0]:6.1f}MHz" + " " * (width - 20) + f"{display_freqs[-1]:6.1f}MHz│"
@@ -204,37 +333,22 @@ class SDRMonitor:
             for _ in range(height):
                 lines.append("│" + " " * (width - 2) + "│")
         else:
-            # Show recent spectrum history
-            recent_spectra = self.spectrum_history[-height:]
+            # Show recent spectrum history, newest first, downsampled in DC-centered order
+            recent_spectra = self.recent(self.spectrum_history, height)
+            grid = np.stack([spectrum[self.display_indices(len(spectrum), width - 2)]
+                             for spectrum in reversed(recent_spectra)])
             
-            for spectrum in reversed(recent_spectra):
-                line = "│"
-                # Downsample spectrum
-                if len(spectrum) > width - 2:
-                    indices = np.linspace(0, len(spectrum) - 1, width - 2, dtype=int)
-                    display_spectrum = spectrum[indices]
-                else:
-                    display_spectrum = spectrum
-                    
-                # Normalize and convert to characters
-                if len(display_spectrum) > 0:
-                    norm_spec = (display_spectrum - np.min(display_spectrum)) / (np.max(display_spectrum) - np.min(display_spectrum) + 1e-12)
-                    for val in norm_spec:
-                        if val > 0.8:
-                            line += "█"
-                        elif val > 0.6:
-                            line += "▓"
-                        elif val > 0.4:
-                            line += "▒"
-                        elif val > 0.2:
-                            line += "░"
-                        else:
-                            line += " "
-                else:
-                    line += " " * (width - 2)
-                    
-                line += "│"
-                lines.append(line)
+            # Normalize each row and convert to characters in one pass
+            if grid.shape[1] > 0:
+                row_min = grid.min(axis=1, keepdims=True)
+                row_max = grid.max(axis=1, keepdims=True)
+                norm_grid = (grid - row_min) / (row_max - row_min + 1e-12)
+                chars = WATERFALL_CHARS[np.digitize(norm_grid, WATERFALL_LEVELS, right=True)]
+                for row in chars:
+                    lines.append("│" + "".join(row) + "│")
+            else:
+                for _ in recent_spectra:
+                    lines.append("│" + " " * (width - 2) + "│")
                 
         lines.append(f"└{'─' * (width - 2)}┘")
         return lines
@@ -276,12 +390,12 @@ class SDRMonitor:
         
     def display_frame(self, metrics):
         """Display complete frame like nvtop"""
-        self.clear_screen()
-        
         # Header
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"📡 SDR Monitor v1.0 - ADALM-Pluto Real-Time Analysis │ {timestamp}")
-        print("═" * 120)
+        timestamp = self.timestamp()
+        lines = [
+            f"📡 SDR Monitor v1.0 - ADALM-Pluto Real-Time Analysis │ {timestamp}",
+            self.BAR_HEAVY,
+        ]
         
         # Top row: Spectrum and Info
         spectrum_lines = self.create_spectrum_display(metrics['freqs'], metrics['power_db'], 80, 12)
@@ -291,9 +405,9 @@ class SDRMonitor:
         for i in range(max_lines):
             left = spectrum_lines[i] if i < len(spectrum_lines) else " " * 80
             right = info_lines[i] if i < len(info_lines) else " " * 43
-            print(f"{left} {right}")
+            lines.append(f"{left} {right}")
             
-        print()
+        lines.append("")
         
         # Middle row: Waterfall and Metrics
         waterfall_lines = self.create_waterfall_display(60, 10)
@@ -303,14 +417,14 @@ class SDRMonitor:
         for i in range(max_lines):
             left = waterfall_lines[i] if i < len(waterfall_lines) else " " * 60
             right = metrics_lines[i] if i < len(metrics_lines) else " " * 43
-            print(f"{left} {right}")
+            lines.append(f"{left} {right}")
             
-        print()
+        lines.append("")
         
         # Bottom row: History charts
-        power_chart = self.create_bar_chart(self.power_history[-20:], 40, 6, "Power History", "dB")
-        snr_chart = self.create_bar_chart(self.snr_history[-20:], 40, 6, "SNR History", "dB")
-        temp_chart = self.create_bar_chart(self.temp_history[-20:], 40, 6, "Temperature", "°C")
+        power_chart = self.create_bar_chart(self.recent(self.power_history, 20), 40, 6, "Power History", "dB")
+        snr_chart = self.create_bar_chart(self.recent(self.snr_history, 20), 40, 6, "SNR History", "dB")
+        temp_chart = self.create_bar_chart(self.recent(self.temp_history, 20), 40, 6, "Temperature", "°C")
         
         # Display charts side by side
         max_chart_lines = max(len(power_chart), len(snr_chart), len(temp_chart))
@@ -318,11 +432,16 @@ class SDRMonitor:
             left = power_chart[i] if i < len(power_chart) else " " * 42
             middle = snr_chart[i] if i < len(snr_chart) else " " * 42
             right = temp_chart[i] if i < len(temp_chart) else " " * 42
-            print(f"{left} {middle} {right}")
+            lines.append(f"{left} {middle} {right}")
             
         # Footer
-        print("\n" + "─" * 120)
-        print("Press Ctrl+C to exit │ Update rate: 10 FPS │ Like nvtop but for SDR!")
+        lines.append("")
+        lines.append(self.BAR_LIGHT)
+        lines.append("Press Ctrl+C to exit │ Update rate: 10 FPS │ Like nvtop but for SDR!")
+        
+        # Clear and redraw in a single write so the terminal never shows a partial frame
+        sys.stdout.write(self.CLEAR + "\n".join(lines) + "\n")
+        sys.stdout.flush()
         
     def run(self):
         """Main monitoring loop"""
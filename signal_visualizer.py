@@ -5,18 +5,91 @@ Real-time and log-based signal visualization
 """
 
 import numpy as np
+from scipy import fft as sp_fft
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from matplotlib.colors import LogNorm
 from matplotlib.widgets import Button
 import json
 import csv
+import os
 import adi
 from datetime import datetime
 import threading
+import queue
 import time
 
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _spectrum_db_numpy(fft_data, out):
+    """Write the DC-centered dB spectrum of fft_data (FFT bin order) into out"""
+    # 10*log10(|X|^2) equals 20*log10(|X|) without taking the square root
+    shifted = sp_fft.fftshift(fft_data)
+    np.multiply(shifted.real, shifted.real, out=out)
+    out += shifted.imag * shifted.imag
+    out += 1e-24
+    np.log10(out, out=out)
+    out *= 10
+
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True, nogil=True)
+    def _spectrum_db(fft_data, out):
+        """Single-pass version of _spectrum_db_numpy"""
+        n = fft_data.shape[0]
+        half = n // 2
+        for i in range(n):
+            j = i + half
+            if j >= n:
+                j -= n
+            v = fft_data[i]
+            out[j] = 10.0 * np.log10(v.real * v.real + v.imag * v.imag + 1e-24)
+else:
+    _spectrum_db = _spectrum_db_numpy
+
+
+def _load_json(path):
+    """Parse a JSON log, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+# Scatter markers cost Python-side time per point; denser captures are strided or binned
+CONSTELLATION_MAX_POINTS = 2048
+
+
+def _widen(limits, lo, hi):
+    """Axis limits covering [lo, hi] with a 10% margin, or None if limits already cover it"""
+    if limits is not None:
+        if limits[0] <= lo and hi <= limits[1]:
+            return None
+        lo, hi = min(lo, limits[0]), max(hi, limits[1])
+    margin = 0.1 * (hi - lo) or 1.0
+    return lo - margin, hi + margin
+
+
 class SignalVisualizer:
-    def __init__(self):
+    def __init__(self, use_gpu=False):
         """Initialize the signal visualizer"""
         self.fig = None
         self.axes = None
@@ -24,6 +97,46 @@ class SignalVisualizer:
         self.data_buffer = []
         self.running = False
         self.sdr = None
+        self.frame_interval = 0.5  # seconds between animation frames
+        
+        # Capture configuration, shared by the PlutoSDR setup, the synthetic source and the plot limits
+        self.sample_rate = 2.4e6
+        self.center_freq = 2.4e9
+        self.buffer_size = 1024
+        self._rng = np.random.default_rng()  # synthetic data
+        self._synth_cache = None  # ((N, fs, fc), complex64 tone) for the synthetic signal
+        
+        # Capture thread hands frames to the animation through a small bounded queue
+        self._frames = queue.Queue(maxsize=2)
+        self._capture_thread = None
+        
+        # Waterfall ring buffer: one float32 row per spectrum, sized on the first frame
+        self.waterfall_depth = 50  # Keep last 50 spectra
+        self.waterfall = None
+        self._wf_idx = 0  # row the next spectrum is written to
+        self._wf_filled = 0
+        
+        # Persistent plot artists, created in setup_plots and updated in place every frame
+        self._spec_line = None
+        self._real_line = None
+        self._imag_line = None
+        self._wf_im = None
+        self._const = None
+        self._view_key = None  # (bins, sample_rate, center_freq) the axis limits were set for
+        self._refit_limits = True  # amplitude limits still need fitting to real data
+        self._artists = []  # artists drawn by the last animation frame
+        
+        # Plot axes reused across frames while the capture geometry is unchanged
+        self._freq_key = None  # (bins, sample_rate, center_freq) of the cached frequency axis
+        self._actual_freqs = None
+        self._time_axis = None
+        
+        # Optional CuPy backend for the spectrum; results come back to the host only for plotting
+        self.use_gpu = use_gpu and CUPY_AVAILABLE
+        self._xp = cp if self.use_gpu else np
+        self._stream = cp.cuda.Stream(non_blocking=True) if self.use_gpu else None
+        self._pinned_samples = None  # page-locked host staging buffer for host-to-device copies
+        self._gpu_samples = None
         
     def setup_plots(self):
         """Setup the plot layout"""
@@ -35,34 +148,51 @@ class SignalVisualizer:
         self.axes[0,0].set_xlabel('Frequency (MHz)')
         self.axes[0,0].set_ylabel('Amplitude (dB)')
         self.axes[0,0].grid(True)
+        self._spec_line, = self.axes[0,0].plot([], [], 'b-', linewidth=1)
         
         # Time domain plot (top right)
         self.axes[0,1].set_title('Time Domain Signal')
         self.axes[0,1].set_xlabel('Sample')
         self.axes[0,1].set_ylabel('Amplitude')
         self.axes[0,1].grid(True)
+        self._real_line, = self.axes[0,1].plot([], [], 'r-', label='Real', alpha=0.7)
+        self._imag_line, = self.axes[0,1].plot([], [], 'b-', label='Imag', alpha=0.7)
+        self.axes[0,1].legend()
         
         # Waterfall plot (bottom left)
         self.axes[1,0].set_title('Waterfall Display')
         self.axes[1,0].set_xlabel('Frequency (MHz)')
-        self.axes[1,0].set_ylabel('Time')
+        self.axes[1,0].set_ylabel('Time (updates)')
+        self._wf_im = self.axes[1,0].imshow(np.zeros((self.waterfall_depth, 1), dtype=np.float32),
+                                          aspect='auto', cmap='viridis', vmin=-120, vmax=0)
+        self._wf_im.set_visible(False)  # shown once two spectra are stored
         
         # Constellation plot (bottom right)
         self.axes[1,1].set_title('IQ Constellation')
         self.axes[1,1].set_xlabel('I (Real)')
         self.axes[1,1].set_ylabel('Q (Imaginary)')
         self.axes[1,1].grid(True)
+        self.axes[1,1].set_aspect('equal', adjustable='box')
+        self._const = self.axes[1,1].scatter([], [], alpha=0.6, s=1, c='blue')
+        
+        # Limits are managed explicitly; fix the known axes now so the first frame does not autoscale
+        for ax in self.axes.flat:
+            ax.set_autoscale_on(False)
+        self.set_axis_geometry(self.buffer_size, self.sample_rate, self.center_freq)
+        self._refit_limits = True
         
+        # Layout is solved once here and again only when the window is resized, not every frame
         plt.tight_layout()
+        self.fig.canvas.mpl_connect('resize_event', lambda event: self.fig.tight_layout())
         
     def connect_pluto(self):
         """Connect to PlutoSDR"""
         try:
             self.sdr = adi.ad9361(uri='ip:192.168.2.1')
-            self.sdr.sample_rate = int(2.4e6)
-            self.sdr.rx_lo = int(2.4e9)
+            self.sdr.sample_rate = int(self.sample_rate)
+            self.sdr.rx_lo = int(self.center_freq)
             self.sdr.rx_rf_bandwidth = int(2e6)
-            self.sdr.rx_buffer_size = 1024
+            self.sdr.rx_buffer_size = self.buffer_size
             self.sdr.gain_control_mode_chan0 = 'manual'
             self.sdr.rx_hardwaregain_chan0 = 60
             print("✅ Connected to PlutoSDR")
@@ -75,91 +205,188 @@ class SignalVisualizer:
         """Capture data from PlutoSDR or generate synthetic data"""
         try:
             if self.sdr:
-                # Try to capture real data
-                samples = self.sdr.rx()
+                # Try to capture real data (single precision halves the bytes every stage touches)
+                samples = self.sdr.rx().astype(np.complex64, copy=False)
                 return samples, self.sdr.sample_rate, self.sdr.rx_lo
             else:
                 # Generate synthetic data for demonstration
-                N = 1024
-                fs = 2.4e6
+                N = self.buffer_size
+                fs = self.sample_rate
                 fc = 1e6  # 1 MHz tone
-                t = np.arange(N) / fs
                 
-                # Create a complex signal with noise
-                signal = np.exp(1j * 2 * np.pi * fc * t) * 0.5
-                noise = (np.random.random(N) + 1j * np.random.random(N) - 0.5 - 0.5j) * 0.1
-                samples = signal + noise
+                # Create a complex signal with noise; the tone only depends on (N, fs, fc), so it is built once
+                key = (N, fs, fc)
+                if self._synth_cache is None or self._synth_cache[0] != key:
+                    t = np.arange(N) / fs
+                    self._synth_cache = (key, (np.exp(1j * 2 * np.pi * fc * t) * 0.5).astype(np.complex64))
+                signal = self._synth_cache[1]
                 
-                return samples, fs, 2.4e9
+                # Uniform I/Q noise drawn as float32 pairs straight into complex64 layout
+                samples = self._rng.random(2 * N, dtype=np.float32).view(np.complex64)
+                samples -= np.complex64(0.5 + 0.5j)
+                samples *= np.float32(0.1)
+                samples += signal
+                
+                return samples, fs, self.center_freq
         except Exception as e:
             print(f"⚠️ Data capture failed: {e}, using synthetic data")
             # Fallback to synthetic data
-            N = 1024
-            samples = np.random.random(N) + 1j * np.random.random(N)
-            return samples, 2.4e6, 2.4e9
+            N = self.buffer_size
+            samples = self._rng.random(2 * N, dtype=np.float32).view(np.complex64)
+            return samples, self.sample_rate, self.center_freq
             
-    def update_plots(self, samples, sample_rate, center_freq):
-        """Update all plots with new data"""
-        # Clear previous plots
-        for ax in self.axes.flat:
-            ax.clear()
+    def _capture_loop(self):
+        """Capture and transform frames until stopped, replacing the oldest queued frame when the display falls behind"""
+        while self.running:
+            samples, sample_rate, center_freq = self.capture_data()
+            # The FFT releases the GIL, so the spectrum is computed here while the GUI thread draws
+            frame = (samples, self.compute_power_db(samples), sample_rate, center_freq)
+            try:
+                self._frames.put(frame, timeout=self.frame_interval)
+            except queue.Full:
+                try:
+                    self._frames.get_nowait()
+                except queue.Empty:
+                    pass
+                self._frames.put_nowait(frame)
+                
+    def compute_power_db(self, samples, out=None):
+        """DC-centered power spectrum in dB, written to out (a new host array if None)"""
+        if out is None:
+            out = np.empty(len(samples), dtype=np.float32)
             
-        # 1. Spectrum Plot
-        fft_data = np.fft.fftshift(np.fft.fft(samples))
-        freqs = np.fft.fftshift(np.fft.fftfreq(len(samples), 1/sample_rate))
-        power_db = 20 * np.log10(np.abs(fft_data) + 1e-12)
-        actual_freqs = (center_freq + freqs) / 1e6  # Convert to MHz
+        if self.use_gpu:
+            xp = self._xp
+            if self._pinned_samples is None or len(self._pinned_samples) != len(samples):
+                host = cp.cuda.alloc_pinned_memory(len(samples) * np.dtype(np.complex64).itemsize)
+                self._pinned_samples = np.frombuffer(host, dtype=np.complex64, count=len(samples))
+                self._gpu_samples = cp.empty(len(samples), dtype=cp.complex64)
+                
+            # Staging through pinned memory turns the upload into an async DMA on our stream
+            np.copyto(self._pinned_samples, samples)
+            with self._stream:
+                self._gpu_samples.set(self._pinned_samples, stream=self._stream)
+                fft_data = xp.fft.fftshift(xp.fft.fft(self._gpu_samples))
+                power_db = 10 * xp.log10(fft_data.real**2 + fft_data.imag**2 + 1e-24)
+                return xp.asnumpy(power_db.astype(out.dtype, copy=False), out=out)
+                
+        _spectrum_db(sp_fft.fft(samples, workers=-1), out)
+        return out
         
-        self.axes[0,0].plot(actual_freqs, power_db, 'b-', linewidth=1)
-        self.axes[0,0].set_title('Real-Time Spectrum')
-        self.axes[0,0].set_xlabel('Frequency (MHz)')
-        self.axes[0,0].set_ylabel('Amplitude (dB)')
-        self.axes[0,0].grid(True)
+    def frequency_axis(self, n, sample_rate, center_freq):
+        """DC-centered absolute frequency axis in MHz, recomputed only when tuning changes"""
+        key = (n, sample_rate, center_freq)
+        if key != self._freq_key:
+            freqs = np.fft.fftshift(np.fft.fftfreq(n, 1/sample_rate))
+            self._actual_freqs = (center_freq + freqs) / 1e6  # Convert to MHz
+            self._freq_key = key
+        return self._actual_freqs
+        
+    def time_axis(self, n):
+        """Sample index axis for the time domain plot"""
+        if self._time_axis is None or len(self._time_axis) != n:
+            self._time_axis = np.arange(n)
+        return self._time_axis
+        
+    def next_waterfall_row(self, n):
+        """Claim the next waterfall row for an n-bin spectrum, overwriting the oldest once full"""
+        if self.waterfall is None or self.waterfall.shape[1] != n:
+            self.waterfall = np.full((self.waterfall_depth, n), -120.0, dtype=np.float32)
+            self._wf_idx = 0
+            self._wf_filled = 0
+        row = self.waterfall[self._wf_idx]
+        self._wf_idx = (self._wf_idx + 1) % self.waterfall_depth
+        self._wf_filled = min(self._wf_filled + 1, self.waterfall_depth)
+        return row
+        
+    def waterfall_rows(self):
+        """Stored spectra, oldest first"""
+        if self._wf_filled < self.waterfall_depth:
+            return self.waterfall[:self._wf_filled]
+        return np.concatenate((self.waterfall[self._wf_idx:], self.waterfall[:self._wf_idx]))
+        
+    def update_plots(self, samples, sample_rate, center_freq, power_db=None):
+        """Update all plots with new data and return the artists that changed"""
+        # 1. Spectrum Plot
+        # Stored in the waterfall ring; computed straight into it unless the capture thread already did
+        row = self.next_waterfall_row(len(samples))
+        if power_db is None:
+            power_db = self.compute_power_db(samples, out=row)
+        else:
+            row[:] = power_db
+            power_db = row
+        actual_freqs = self.frequency_axis(len(samples), sample_rate, center_freq)
+        self._spec_line.set_data(actual_freqs, power_db)
         
         # 2. Time Domain Plot
-        time_samples = np.arange(len(samples))
-        self.axes[0,1].plot(time_samples, np.real(samples), 'r-', label='Real', alpha=0.7)
-        self.axes[0,1].plot(time_samples, np.imag(samples), 'b-', label='Imag', alpha=0.7)
-        self.axes[0,1].set_title('Time Domain Signal')
-        self.axes[0,1].set_xlabel('Sample')
-        self.axes[0,1].set_ylabel('Amplitude')
-        self.axes[0,1].legend()
-        self.axes[0,1].grid(True)
+        time_samples = self.time_axis(len(samples))
+        self._real_line.set_data(time_samples, np.real(samples))
+        self._imag_line.set_data(time_samples, np.imag(samples))
         
         # 3. Waterfall Plot (simplified)
-        # Store recent spectrum data for waterfall
-        if not hasattr(self, 'waterfall_data'):
-            self.waterfall_data = []
-        
-        self.waterfall_data.append(power_db)
-        if len(self.waterfall_data) > 50:  # Keep last 50 spectra
-            self.waterfall_data.pop(0)
+        if self._wf_filled > 1:
+            waterfall_matrix = self.waterfall_rows()
+            self._wf_im.set_array(waterfall_matrix)
+            self._wf_im.set_extent([actual_freqs[0], actual_freqs[-1], self._wf_filled, 0])
+            self._wf_im.set_clim(waterfall_matrix.min(), waterfall_matrix.max())
+            self._wf_im.set_visible(True)
             
-        if len(self.waterfall_data) > 1:
-            waterfall_matrix = np.array(self.waterfall_data)
-            im = self.axes[1,0].imshow(waterfall_matrix, aspect='auto', 
-                                     extent=[actual_freqs[0], actual_freqs[-1], 
-                                           len(self.waterfall_data), 0],
-                                     cmap='viridis')
-            self.axes[1,0].set_title('Waterfall Display')
-            self.axes[1,0].set_xlabel('Frequency (MHz)')
-            self.axes[1,0].set_ylabel('Time (updates)')
+        # 4. Constellation Plot (strided down to at most CONSTELLATION_MAX_POINTS markers)
+        # Interleaved complex samples viewed as (N, 2) I/Q rows, so no column_stack copy is needed
+        step = -(-len(samples) // CONSTELLATION_MAX_POINTS)
+        iq_pairs = np.ascontiguousarray(samples).view(samples.real.dtype).reshape(-1, 2)
+        self._const.set_offsets(iq_pairs[::step])
+        
+        # Blitted frames do not redraw ticks, so limits only change (with a full redraw) when the data outgrows them
+        if self.update_limits(samples, sample_rate, center_freq, power_db):
+            self.fig.tight_layout()  # tick labels may have changed width
+            self.fig.canvas.draw()
             
-        # 4. Constellation Plot
-        self.axes[1,1].scatter(np.real(samples), np.imag(samples), 
-                              alpha=0.6, s=1, c='blue')
-        self.axes[1,1].set_title('IQ Constellation')
-        self.axes[1,1].set_xlabel('I (Real)')
-        self.axes[1,1].set_ylabel('Q (Imaginary)')
-        self.axes[1,1].grid(True)
-        self.axes[1,1].axis('equal')
+        return [self._spec_line, self._real_line, self._imag_line, self._wf_im, self._const]
         
-        plt.tight_layout()
+    def set_axis_geometry(self, n, sample_rate, center_freq):
+        """Fix the frequency and sample axes for n-sample captures at the given tuning"""
+        self._view_key = (n, sample_rate, center_freq)
+        actual_freqs = self.frequency_axis(n, sample_rate, center_freq)
+        self.axes[0,0].set_xlim(actual_freqs[0], actual_freqs[-1])
+        self.axes[0,1].set_xlim(0, n - 1)
+        self.axes[1,0].set_xlim(actual_freqs[0], actual_freqs[-1])
+        self.axes[1,0].set_ylim(self.waterfall_depth, 0)
+        
+    def update_limits(self, samples, sample_rate, center_freq, power_db):
+        """Fit axis limits to the current frame; returns True if any limits changed"""
+        view_key = (len(samples), sample_rate, center_freq)
+        if view_key != self._view_key:
+            # New capture geometry: refit everything else from scratch too
+            self.set_axis_geometry(*view_key)
+            self._refit_limits = True
+        changed = self._refit_limits
+        self._refit_limits = False
+        
+        spec_limits = _widen(None if changed else self.axes[0,0].get_ylim(), power_db.min(), power_db.max())
+        if spec_limits:
+            self.axes[0,0].set_ylim(spec_limits)
+            
+        real, imag = np.real(samples), np.imag(samples)
+        time_limits = _widen(None if changed else self.axes[0,1].get_ylim(),
+                             min(real.min(), imag.min()), max(real.max(), imag.max()))
+        if time_limits:
+            self.axes[0,1].set_ylim(time_limits)
+            
+        radius = max(np.abs(real).max(), np.abs(imag).max())
+        const_limits = _widen(None if changed else self.axes[1,1].get_ylim(), -radius, radius)
+        if const_limits:
+            self.axes[1,1].set_xlim(const_limits)
+            self.axes[1,1].set_ylim(const_limits)
+            
+        return changed or bool(spec_limits or time_limits or const_limits)
         
     def start_real_time(self):
         """Start real-time visualization"""
         print("🚀 Starting real-time visualization...")
         print("📊 Close the plot window to stop")
+        if self.use_gpu:
+            print("🎮 Computing spectrum on the GPU (CuPy)")
         
         # Setup plots
         self.setup_plots()
@@ -169,22 +396,41 @@ class SignalVisualizer:
         if not connected:
             print("⚠️ Using synthetic data for demonstration")
             
+        # Capture on a background thread so blocking sdr.rx() calls never stall the GUI
+        self.running = True
+        self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._capture_thread.start()
+        
         # Animation function
         def animate(frame):
             if not plt.get_fignums():  # Check if window is closed
-                return
+                return ()
                 
-            samples, sample_rate, center_freq = self.capture_data()
-            self.update_plots(samples, sample_rate, center_freq)
+            try:
+                samples, power_db, sample_rate, center_freq = self._frames.get_nowait()
+            except queue.Empty:
+                return self._artists  # No new capture yet; keep the previous frame
+                
+            self._artists = self.update_plots(samples, sample_rate, center_freq, power_db)
+            return self._artists
             
-        # Start animation
-        ani = animation.FuncAnimation(self.fig, animate, interval=500, blit=False)
+        def init():
+            self._artists = [self._spec_line, self._real_line, self._imag_line, self._wf_im, self._const]
+            return self._artists
+            
+        # Start animation (blitting redraws only the data artists each frame)
+        ani = animation.FuncAnimation(self.fig, animate, init_func=init,
+                                      interval=int(self.frame_interval * 1000), blit=True)
         
         # Add timestamp
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.fig.suptitle(f'ADALM-Pluto SDR Signal Visualization - {timestamp}', fontsize=14)
         
-        plt.show()
+        try:
+            plt.show()
+        finally:
+            self.running = False
+            self._capture_thread.join(timeout=1.0)
         
     def visualize_log_file(self, log_file):
         """Visualize data from a log file"""
@@ -202,22 +448,18 @@ class SignalVisualizer:
             
     def visualize_csv_log(self, csv_file):
         """Visualize spectrum data from CSV log"""
-        frequencies = []
-        amplitudes = []
-        
-        with open(csv_file, 'r') as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if row and not row[0].startswith('#') and row[0] != 'Frequency_Hz':
-                    try:
-                        freq = float(row[0]) / 1e6  # Convert to MHz
-                        amp = float(row[1])
-                        frequencies.append(freq)
-                        amplitudes.append(amp)
-                    except (ValueError, IndexError):
-                        continue
-                        
-        if frequencies and amplitudes:
+        try:
+            # Parse both columns in one vectorized pass; metadata comments and the header are skipped
+            with open(csv_file, 'r') as f:
+                data = np.loadtxt((line for line in f if not line.startswith('Frequency_Hz')),
+                                  delimiter=',', comments='#', usecols=(0, 1), ndmin=2)
+            frequencies = data[:, 0] / 1e6  # Convert to MHz
+            amplitudes = data[:, 1]
+        except (ValueError, IndexError):
+            # Malformed rows: fall back to the row parser, which skips them
+            frequencies, amplitudes = self._parse_csv_rows(csv_file)
+            
+        if len(frequencies) and len(amplitudes):
             plt.figure(figsize=(12, 6))
             plt.plot(frequencies, amplitudes, 'b-', linewidth=1)
             plt.title(f'Spectrum Data from {csv_file}')
@@ -228,42 +470,95 @@ class SignalVisualizer:
         else:
             print("❌ No valid data found in CSV file")
             
+    def _parse_csv_rows(self, csv_file):
+        """Row-by-row CSV parser that skips rows without two numeric columns"""
+        # First pass sizes the output (the line count bounds the row count), second pass fills it
+        with open(csv_file, 'r') as f:
+            max_rows = sum(1 for _ in f)
+        frequencies = np.empty(max_rows)
+        amplitudes = np.empty(max_rows)
+        count = 0
+        
+        with open(csv_file, 'r') as f:
+            reader = csv.reader(f)
+            for row in reader:
+                if row and not row[0].startswith('#') and row[0] != 'Frequency_Hz':
+                    try:
+                        freq = float(row[0])
+                        amp = float(row[1])
+                    except (ValueError, IndexError):
+                        continue
+                    frequencies[count] = freq
+                    amplitudes[count] = amp
+                    count += 1
+                    
+        frequencies = frequencies[:count]
+        frequencies /= 1e6  # Convert to MHz
+        return frequencies, amplitudes[:count]
+        
     def visualize_json_log(self, json_file):
         """Visualize signal data from JSON log"""
-        with open(json_file, 'r') as f:
-            data = json.load(f)
-            
+        data = _load_json(json_file)
+        
+        # Waterfall logs may keep the power matrix in a .npy sidecar next to a small JSON header
+        power_file = os.path.splitext(json_file)[0] + '_power.npy'
+        
         if 'signal_data' in data:
             # Signal capture visualization
-            real_data = data['signal_data']['real']
-            imag_data = data['signal_data']['imag']
+            # Convert the JSON lists once so plotting and the FFT work on float32 arrays
+            real_data = np.asarray(data['signal_data']['real'], dtype=np.float32)
+            imag_data = data['signal_data'].get('imag')
+            imag_data = np.asarray(imag_data, dtype=np.float32) if imag_data else None
             
             fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
             
             # Time domain
             samples = np.arange(len(real_data))
             ax1.plot(samples, real_data, 'r-', label='Real', alpha=0.7)
-            ax1.plot(samples, imag_data, 'b-', label='Imag', alpha=0.7)
+            if imag_data is not None:
+                ax1.plot(samples, imag_data, 'b-', label='Imag', alpha=0.7)
             ax1.set_title('Time Domain Signal')
             ax1.set_xlabel('Sample')
             ax1.set_ylabel('Amplitude')
             ax1.legend()
             ax1.grid(True)
             
-            # Constellation
-            ax2.scatter(real_data, imag_data, alpha=0.6, s=2)
-            ax2.set_title('IQ Constellation')
-            ax2.set_xlabel('I (Real)')
-            ax2.set_ylabel('Q (Imaginary)')
-            ax2.grid(True)
-            ax2.axis('equal')
+            if imag_data is not None:
+                # Constellation (binned into a single image for long captures)
+                if len(real_data) > CONSTELLATION_MAX_POINTS:
+                    ax2.hist2d(real_data, imag_data, bins=256, cmap='viridis', norm=LogNorm())
+                else:
+                    ax2.scatter(real_data, imag_data, alpha=0.6, s=2)
+                ax2.set_title('IQ Constellation')
+                ax2.set_xlabel('I (Real)')
+                ax2.set_ylabel('Q (Imaginary)')
+                ax2.grid(True)
+                ax2.axis('equal')
+            else:
+                # Real-only capture: the spectrum is Hermitian, so rfft gives every unique bin at half the cost
+                sample_rate = data.get('capture_info', {}).get('sample_rate')
+                fft_data = sp_fft.rfft(real_data)
+                power_db = 10 * np.log10(fft_data.real**2 + fft_data.imag**2 + 1e-24)
+                if sample_rate:
+                    freqs = sp_fft.rfftfreq(len(real_data), 1/sample_rate) / 1e6  # Convert to MHz
+                    ax2.set_xlabel('Frequency (MHz)')
+                else:
+                    freqs = sp_fft.rfftfreq(len(real_data))
+                    ax2.set_xlabel('Frequency (cycles/sample)')
+                ax2.plot(freqs, power_db, 'b-', linewidth=1)
+                ax2.set_title('Single-Sided Spectrum')
+                ax2.set_ylabel('Amplitude (dB)')
+                ax2.grid(True)
             
             plt.tight_layout()
             plt.show()
             
-        elif 'data' in data and 'power_matrix' in data['data']:
-            # Waterfall visualization
-            power_matrix = np.array(data['data']['power_matrix'])
+        elif 'data' in data and ('power_matrix' in data['data'] or os.path.exists(power_file)):
+            # Waterfall visualization (a memory-mapped sidecar is paged in lazily, without a copy)
+            if os.path.exists(power_file):
+                power_matrix = np.load(power_file, mmap_mode='r')
+            else:
+                power_matrix = np.array(data['data']['power_matrix'])
             frequencies = np.array(data['data']['frequencies']) / 1e6  # Convert to MHz
             timestamps = data['data']['timestamps']
             
@@ -282,7 +577,7 @@ class SignalVisualizer:
 
 def main():
     """Main function with user menu"""
-    visualizer = SignalVisualizer()
+    visualizer = SignalVisualizer(use_gpu=CUPY_AVAILABLE)
     
     print("📊 ADALM-Pluto Signal Visualizer")
     print("=" * 40)
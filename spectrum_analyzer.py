@@ -2,7 +2,7 @@ import sys
 import numpy as np
 import adi
 import time
-from scipy.signal import (firwin, lfilter, kaiserord, find_peaks)
+from scipy.signal import (firwin, oaconvolve, kaiserord, find_peaks)
 import pyqtgraph as pg
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QWidget,
@@ -316,7 +316,9 @@ class MainWindow(QMainWindow):
     # Function to extract amplitude using the current FIR filter
     ##########################################################################
     def extract_amplitude(self, rx_signal):
-        filtered_signal = lfilter(self.b_filt, 1.0, rx_signal)
+        # Leading len(rx_signal) samples of the full convolution are exactly
+        # the causal lfilter(b, 1.0, x) output
+        filtered_signal = oaconvolve(rx_signal, self.b_filt)[:len(rx_signal)]
         amplitude = np.abs(filtered_signal)
         return np.mean(amplitude)
 